@@ -7,14 +7,30 @@ __version__ = "1.0.0"
 __author__ = "WordPress Auto Installer Team"
 __description__ = "Automated WordPress installation tool for developers"
 
-# Import only the classes, not the instances
-from .core.wordpress import WordPressInstaller
-from .core.database import DatabaseManager
-from .utils.config import ConfigManager, config_manager
-from .utils.logger import Logger, logger
-from .utils.helpers import Helpers
-from .utils.cli import WordPressCLI
-from .gui.main_window import MainWindow, run_gui
+import importlib
+
+# Public names are imported on first access so the CLI does not load the GUI or core up front
+_EXPORTS = {
+    'WordPressInstaller': '.core.wordpress',
+    'DatabaseManager': '.core.database',
+    'ConfigManager': '.utils.config',
+    'config_manager': '.utils.config',
+    'Logger': '.utils.logger',
+    'logger': '.utils.logger',
+    'Helpers': '.utils.helpers',
+    'WordPressCLI': '.utils.cli',
+    'MainWindow': '.gui.main_window',
+    'run_gui': '.gui.main_window',
+}
+
+def __getattr__(name):
+    """Import a public name from its submodule on first use"""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     'WordPressInstaller',
@@ -6,7 +6,7 @@ Handles MySQL database creation, deletion, and management
 
 import subprocess
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List
 from ..utils.logger import logger
 from ..utils.config import config_manager
 
@@ -182,6 +182,32 @@ class DatabaseManager:
             logger.debug(f"Error getting database size for {db_name}: {e}")
             return "Unknown"
     
+    def get_database_sizes(self) -> Dict[str, str]:
+        """Get the size of every database in one query, keyed by database name"""
+        try:
+            query = """
+                SELECT 
+                    table_schema,
+                    ROUND(SUM(data_length + index_length) / 1024 / 1024, 2)
+                FROM information_schema.tables 
+                GROUP BY table_schema;
+            """
+            result = self.run_mysql_command(query)
+            if result.returncode != 0:
+                return {}
+            
+            sizes = {}
+            # Skip the column header row
+            for line in result.stdout.strip().split('\n')[1:]:
+                name, _, size_mb = line.strip().partition('\t')
+                if name and size_mb and size_mb != 'NULL':
+                    sizes[name] = f"{size_mb} MB"
+            return sizes
+        
+        except Exception as e:
+            logger.debug(f"Error getting database sizes: {e}")
+            return {}
+    
     def backup_database(self, db_name: str, backup_path: str) -> bool:
         """Backup database to SQL file"""
         try:
@@ -6,7 +6,6 @@ Handles WordPress extraction, configuration, and WP-CLI operations
 
 import os
 import shutil
-import zipfile
 import subprocess
 import sys
 from pathlib import Path
@@ -128,46 +127,12 @@ class WordPressInstaller:
     
     def extract_wordpress(self, zip_path: str, site_path: str) -> bool:
         """Extract WordPress from zip file"""
-        try:
-            logger.step(f"Extracting WordPress to: {site_path}")
-            
-            if not os.path.exists(zip_path):
-                logger.error(f"WordPress zip file not found: {zip_path}")
-                return False
-            
-            # Create site directory if it doesn't exist
-            os.makedirs(site_path, exist_ok=True)
-            
-            # Extract the zip file
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                # Extract all files
-                zip_ref.extractall(site_path)
-                
-                # WordPress typically extracts to a 'wordpress' folder
-                wordpress_dir = os.path.join(site_path, 'wordpress')
-                if os.path.exists(wordpress_dir):
-                    # Move all files from wordpress folder to site_path
-                    for item in os.listdir(wordpress_dir):
-                        src = os.path.join(wordpress_dir, item)
-                        dst = os.path.join(site_path, item)
-                        if os.path.isdir(src):
-                            if os.path.exists(dst):
-                                shutil.rmtree(dst)
-                            shutil.move(src, dst)
-                        else:
-                            if os.path.exists(dst):
-                                os.remove(dst)
-                            shutil.move(src, dst)
-                    
-                    # Remove the now-empty wordpress directory
-                    os.rmdir(wordpress_dir)
-            
-            logger.success(f"WordPress extracted successfully to {site_path}")
-            return True
-            
-        except Exception as e:
-            logger.error(f"Error extracting WordPress: {e}")
+        if not os.path.exists(zip_path):
+            logger.error(f"WordPress zip file not found: {zip_path}")
             return False
+        
+        # The helper strips the 'wordpress/' prefix while extracting in parallel
+        return Helpers.extract_wordpress_zip(Path(zip_path), Path(site_path))
     
     def configure_wordpress(self, site_path: str, db_config: Dict[str, str]) -> bool:
         """Configure WordPress using WP-CLI"""
@@ -440,7 +405,7 @@ class WordPressInstaller:
                             'path': item_path,
                             'url': f"http://localhost/{item}",
                             'has_database': self.db_manager.database_exists(f"wp_{item}"),
-                            'size': Helpers.get_directory_size(item_path)
+                            'size': Helpers.get_cached_directory_size(item_path)
                         }
                         
                         # Try to get more info from wp-config.php
@@ -2,3 +2,13 @@
 """
 Components package initialization
 """
+
+# Probe for ttkbootstrap once; every GUI module shares the result
+try:
+    import ttkbootstrap as ttk
+    MODERN_UI = True
+except ImportError:
+    import tkinter.ttk as ttk
+    MODERN_UI = False
+
+__all__ = ['ttk', 'MODERN_UI']
@@ -4,21 +4,17 @@ Bulk Installation Tab Component
 Handles bulk WordPress site installation with templates
 """
 
-import threading
 import time
 import tkinter as tk
-from pathlib import Path
 
-try:
-    import ttkbootstrap as ttk
-    MODERN_UI = True
-except ImportError:
-    import tkinter.ttk as ttk
-    MODERN_UI = False
+from . import ttk, MODERN_UI
 
 from ...utils.logger import logger
 from ...utils.config import config_manager
 
+# Themes offered in the theme picker
+_THEME_VALUES = ("twentytwentyfour", "twentytwentythree", "twentytwentytwo", "astra", "generatepress")
+
 class BulkInstallTab:
     def __init__(self, main_window, notebook):
         self.main_window = main_window
@@ -78,9 +74,7 @@ class BulkInstallTab:
         
         # Theme selection
         ttk.Label(template_frame, text="Theme:").grid(row=2, column=0, sticky="w", padx=5, pady=5)
-        self.theme = ttk.Combobox(template_frame, values=[
-            "twentytwentyfour", "twentytwentythree", "twentytwentytwo", "astra", "generatepress"
-        ], font=("Segoe UI", 10))
+        self.theme = ttk.Combobox(template_frame, values=_THEME_VALUES, font=("Segoe UI", 10))
         self.theme.grid(row=2, column=1, sticky="ew", padx=5, pady=5)
         self.theme.set("twentytwentyfour")
     
@@ -201,8 +195,7 @@ class BulkInstallTab:
                         else:
                             self.update_progress(f"✗ Failed: {site_name}")
                         
-                        self.progress.configure(value=i)
-                        self.main_window.root.update_idletasks()
+                        self.main_window.root.after(0, lambda value=i: self.progress.configure(value=value))
                     
                     self.bulk_running = False
                     self.start_btn.configure(state="normal")
@@ -224,7 +217,8 @@ class BulkInstallTab:
                     self.start_btn.configure(state="normal")
                     self.stop_btn.configure(state="disabled")
             
-            threading.Thread(target=bulk_install, daemon=True).start()
+            # Shares the single install worker so bulk and single installs never overlap
+            self.main_window.install_executor.submit(bulk_install)
             
         except Exception as e:
             self.main_window.toast_manager.show_toast(f"Failed to start bulk installation: {e}", "error")
@@ -242,7 +236,7 @@ class BulkInstallTab:
     
     def get_unique_site_name(self, base_name):
         """Generate unique site name to avoid conflicts"""
-        htdocs_path = Path(config_manager.get('xampp.htdocs_path'))
+        htdocs_path = config_manager.get_htdocs_path()
         original_name = base_name
         counter = 1
         
@@ -11,12 +11,7 @@ import logging
 import tkinter as tk
 from tkinter import filedialog
 
-try:
-    import ttkbootstrap as ttk
-    MODERN_UI = True
-except ImportError:
-    import tkinter.ttk as ttk
-    MODERN_UI = False
+from . import ttk, MODERN_UI
 
 from ...utils.logger import logger
 
@@ -7,16 +7,9 @@ Handles WordPress site management, deletion, and operations
 import threading
 import re
 import webbrowser
-from pathlib import Path
 from tkinter import messagebox
 
-try:
-    import ttkbootstrap as ttk
-    from ttkbootstrap.constants import *
-    MODERN_UI = True
-except ImportError:
-    import tkinter.ttk as ttk
-    MODERN_UI = False
+from . import ttk, MODERN_UI
 
 from ...utils.logger import logger
 from ...utils.config import config_manager
@@ -177,7 +170,7 @@ class ManagementTab:
                     self.sites_tree.delete(item)
                 
                 # Get htdocs path
-                htdocs_path = Path(config_manager.get('xampp.htdocs_path'))
+                htdocs_path = config_manager.get_htdocs_path()
                 base_url = config_manager.get('wordpress.base_url', 'http://localhost')
                 
                 if not htdocs_path.exists():
@@ -359,7 +352,7 @@ class ManagementTab:
             
             def delete_all():
                 try:
-                    htdocs_path = Path(config_manager.get('xampp.htdocs_path'))
+                    htdocs_path = config_manager.get_htdocs_path()
                     test_prefixes = ['test', 'wp_test', 'sample', 'demo', 'dev']
                     
                     deleted_count = 0
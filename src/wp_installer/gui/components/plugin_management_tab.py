@@ -11,13 +11,7 @@ from pathlib import Path
 from tkinter import filedialog, messagebox
 import zipfile
 
-try:
-    import ttkbootstrap as ttk
-    from ttkbootstrap.constants import *
-    MODERN_UI = True
-except ImportError:
-    import tkinter.ttk as ttk
-    MODERN_UI = False
+from . import ttk, MODERN_UI
 
 from ...utils.logger import logger
 from ...utils.config import config_manager
@@ -438,34 +432,39 @@ class PluginManagementTab:
     
     def update_plugins_list(self, plugins):
         """Update the plugins list in the UI"""
-        try:
-            # Clear current items
-            for item in self.plugins_tree.get_children():
-                self.plugins_tree.delete(item)
-            
-            # Add plugins to the tree
-            for plugin in plugins:
-                status = "Active" if plugin.get('status') == 'active' else "Inactive"
-                status_icon = "✅" if plugin.get('status') == 'active' else "⏸️"
-                
-                self.plugins_tree.insert("", "end", 
-                                       text="",
-                                       values=(status_icon + " " + status, 
-                                             plugin.get('name', 'Unknown'),
-                                             plugin.get('version', ''),
-                                             plugin.get('description', '')[:100] + "..." if len(plugin.get('description', '')) > 100 else plugin.get('description', '')),
-                                       tags=(plugin.get('name', ''),))
-            
-            self.installed_plugins = plugins
+        if not isinstance(plugins, list):
+            logger.error(f"Error updating plugins list: expected a list, got {type(plugins).__name__}")
+            return
+        
+        # Clear current items
+        tree = self.plugins_tree
+        tree.delete(*tree.get_children())
+        
+        # Add plugins to the tree
+        tree_insert = tree.insert
+        for plugin in plugins:
+            is_active = plugin.get('status') == 'active'
+            status = "✅ Active" if is_active else "⏸️ Inactive"
             
-            # Update status safely
-            try:
-                self.safe_update_status("Ready")
-            except:
-                logger.info("Plugin list updated")
+            description = plugin.get('description', '')
+            if len(description) > 100:
+                description = description[:100] + "..."
             
-        except Exception as e:
-            logger.error(f"Error updating plugins list: {e}")
+            tree_insert("", "end",
+                        text="",
+                        values=(status,
+                                plugin.get('name', 'Unknown'),
+                                plugin.get('version', ''),
+                                description),
+                        tags=(plugin.get('name', ''),))
+        
+        self.installed_plugins = plugins
+        
+        # Update status safely
+        try:
+            self.safe_update_status("Ready")
+        except:
+            logger.info("Plugin list updated")
     
     def on_plugin_click(self, event):
         """Handle plugin item click for selection"""
@@ -4,19 +4,17 @@ Settings Tab Component
 Handles application configuration management
 """
 
+import os
+import queue
+import re
 import threading
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
-from tkinter import filedialog, messagebox
+from tkinter import filedialog, messagebox, font as tkfont
 from pathlib import Path
-import shutil
 import zipfile
 
-try:
-    import ttkbootstrap as ttk
-    MODERN_UI = True
-except ImportError:
-    import tkinter.ttk as ttk
-    MODERN_UI = False
+from . import ttk, MODERN_UI
 
 from ...utils.helpers import Helpers
 from ...utils.paths import PathUtils
@@ -24,20 +22,118 @@ from ...utils.paths import PathUtils
 from ...utils.logger import logger
 from ...utils.config import config_manager
 
+# Marks a WordPress archive: any wp-admin/ entry or the sample config file
+_WP_MARKER = re.compile(r'(wp-admin/)|(wp-config-sample\.php$)')
+
+# Widget factories specialised once for the active theme
+if MODERN_UI:
+    def _frame(parent, style):
+        return ttk.Frame(parent, bootstyle=style)
+    def _label(parent, text, style, **kwargs):
+        return ttk.Label(parent, text=text, bootstyle=style, **kwargs)
+    def _labelframe(parent, text, style):
+        return ttk.Labelframe(parent, text=text, bootstyle=style)
+    def _button(parent, text, style, command):
+        return ttk.Button(parent, text=text, bootstyle=style, command=command)
+else:
+    def _frame(parent, style):
+        return ttk.Frame(parent)
+    def _label(parent, text, style, **kwargs):
+        return ttk.Label(parent, text=text, **kwargs)
+    def _labelframe(parent, text, style):
+        return ttk.Labelframe(parent, text=text)
+    def _button(parent, text, style, command):
+        return ttk.Button(parent, text=text, command=command)
+
 class SettingsTab:
+    # (form variable, config section, config option, default) for the plain text settings
+    _FIELDS = (
+        ('htdocs_path', 'xampp', 'htdocs_path', ''),
+        ('mysql_host', 'xampp', 'mysql_host', 'localhost'),
+        ('mysql_user', 'xampp', 'mysql_user', 'root'),
+        ('mysql_password', 'xampp', 'mysql_password', ''),
+        ('admin_user', 'wordpress', 'admin_user', 'admin'),
+        ('admin_password', 'wordpress', 'admin_password', ''),
+        ('admin_email', 'wordpress', 'admin_email', ''),
+        ('base_url', 'wordpress', 'base_url', 'http://localhost'),
+    )
+    
+    # (title, bootstyle, [(form variable, label, kind)]) for each configuration section;
+    # kind is None, 'password', 'folder', 'file' or 'zip'
+    SECTIONS = (
+        ("📁 XAMPP Configuration", "primary", (
+            ('htdocs_path', "XAMPP htdocs Path:", 'folder'),
+        )),
+        ("🗄️ MySQL Configuration", "success", (
+            ('mysql_host', "MySQL Host:", None),
+            ('mysql_user', "MySQL User:", None),
+            ('mysql_password', "MySQL Password:", 'password'),
+        )),
+        ("🌐 WordPress Defaults", "warning", (
+            ('admin_user', "Admin Username:", None),
+            ('admin_password', "Admin Password:", 'password'),
+            ('admin_email', "Admin Email:", None),
+            ('base_url', "Base URL:", None),
+            ('wp_zip_path', "WordPress ZIP:", 'zip'),
+        )),
+        ("⚡ WP-CLI Configuration", "danger", (
+            ('wpcli_path', "WP-CLI Path:", 'file'),
+        )),
+    )
+    
+    _PHP_FILETYPES = (("PHP Executable", "php.exe"), ("All Files", "*.*"))
+    _ZIP_FILETYPES = (("ZIP files", "*.zip"), ("All files", "*.*"))
+    
     def __init__(self, main_window, notebook):
         self.main_window = main_window
         self.notebook = notebook
+        self._vars = {}
+        
+        # Bundled ZIP location never changes while the app runs
+        self._app_root_str = str(PathUtils.get_app_base_dir()) + os.sep
+        self._assets_dir = PathUtils.get_app_data_dir("assets")
+        self._wp_zip_target = self._assets_dir / "wordpress-6.8.2.zip"
+        self._wp_zip_target_relative = self._fast_relative(self._wp_zip_target)
+        
+        # Shared named fonts so Tk resolves each spec only once
+        self._entry_font = tkfont.Font(root=notebook, name="wp-settings-entry",
+                                       family="Segoe UI", size=9, exists=False)
+        self._header_font = tkfont.Font(root=notebook, name="wp-settings-header",
+                                        family="Segoe UI", size=14, weight="bold", exists=False)
+        
+        # One long-lived worker runs all background jobs for this tab
+        self._worker_q = queue.Queue()
+        threading.Thread(target=self._worker_loop, daemon=True).start()
+        
+        # Status probes are independent, so run them side by side
+        self._probe_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="settings-probe")
         
         # Create the tab
         self.create_tab()
     
+    def _worker_loop(self):
+        """Run queued background jobs one at a time"""
+        while True:
+            job = self._worker_q.get()
+            try:
+                job()
+            except Exception as e:
+                logger.error(f"Settings background task failed: {e}")
+    
+    def _fast_relative(self, path):
+        """Strip the app base dir prefix, falling back to PathUtils for anything else"""
+        path = str(path)
+        if path.startswith(self._app_root_str):
+            return path[len(self._app_root_str):]
+        return PathUtils.make_relative_to_app(path)
+    
+    def _on_ui(self, callback, *args):
+        """Schedule callback on the Tk thread"""
+        self.main_window.root.after(0, callback, *args)
+    
     def create_tab(self):
         """Create settings configuration tab"""
-        if MODERN_UI:
-            self.frame = ttk.Frame(self.notebook, bootstyle="light")
-        else:
-            self.frame = ttk.Frame(self.notebook)
+        self.frame = _frame(self.notebook, "light")
         self.notebook.add(self.frame, text="⚙️ Settings")
         
         self.frame.columnconfigure(0, weight=1)
@@ -49,21 +145,14 @@ class SettingsTab:
     
     def create_header(self):
         """Create tab header"""
-        if MODERN_UI:
-            header_label = ttk.Label(self.frame, text="Application Settings", 
-                                   font=("Segoe UI", 14, "bold"), bootstyle="primary")
-        else:
-            header_label = ttk.Label(self.frame, text="Application Settings", 
-                                   font=("Segoe UI", 14, "bold"))
+        header_label = _label(self.frame, "Application Settings", "primary",
+                              font=self._header_font)
         header_label.grid(row=0, column=0, pady=10)
     
     def create_settings_form(self):
         """Create comprehensive settings form"""
         # Scrollable frame for settings
-        if MODERN_UI:
-            settings_container = ttk.Labelframe(self.frame, text="🔧 Configuration", bootstyle="info")
-        else:
-            settings_container = ttk.Labelframe(self.frame, text="🔧 Configuration")
+        settings_container = _labelframe(self.frame, "🔧 Configuration", "info")
         settings_container.grid(row=1, column=0, sticky="nsew", padx=20, pady=10)
         settings_container.columnconfigure(0, weight=1)
         settings_container.rowconfigure(0, weight=1)
@@ -73,10 +162,12 @@ class SettingsTab:
         scrollbar = ttk.Scrollbar(settings_container, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        # Recompute the scroll region at most once per idle cycle
+        self.canvas = canvas
+        self.scrollbar = scrollbar
+        self._scroll_pending = False
+        scrollable_frame.bind("<Configure>", self._schedule_scrollregion)
+        canvas.bind("<Configure>", self._schedule_scrollregion)
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
@@ -85,128 +176,110 @@ class SettingsTab:
         scrollbar.grid(row=0, column=1, sticky="ns")
         
         scrollable_frame.columnconfigure(1, weight=1)
+        self.scrollable_frame = scrollable_frame
+        
+        # Setting sections are built the first time the tab is shown
+        self._built = False
+        self._probes_done = False
+        self._pending_sections = [
+            self.create_config_sections,
+            self.create_php_setup_section,
+            self.create_wpcli_setup_section,
+            self.create_action_buttons,
+        ]
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_shown, add="+")
+    
+    def _schedule_scrollregion(self, event=None):
+        """Coalesce scroll region updates triggered by child layout changes"""
+        if self._scroll_pending:
+            return
+        self._scroll_pending = True
+        self.canvas.after_idle(self._apply_scrollregion)
+    
+    def _apply_scrollregion(self):
+        """Update the canvas scroll region to fit the settings form"""
+        self._scroll_pending = False
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        self._maybe_flatten_scroll()
+    
+    def _maybe_flatten_scroll(self):
+        """Hide the scrollbar and stop scrolling while the form fits the canvas"""
+        fits = self.scrollable_frame.winfo_reqheight() <= self.canvas.winfo_height()
+        if fits:
+            self.scrollbar.grid_remove()
+            self.canvas.configure(yscrollcommand="")
+            self.canvas.yview_moveto(0)
+        else:
+            self.scrollbar.grid()
+            self.canvas.configure(yscrollcommand=self.scrollbar.set)
+    
+    def _on_tab_shown(self, event=None):
+        """Build the settings sections on first display of the tab"""
+        if self._built or self.notebook.select() != str(self.frame):
+            return
         
-        # Create setting sections
-        self.create_xampp_settings(scrollable_frame)
-        self.create_mysql_settings(scrollable_frame)
-        self.create_wordpress_settings(scrollable_frame)
-        self.create_wpcli_settings(scrollable_frame)
-        self.create_php_setup_section(scrollable_frame)
-        self.create_wpcli_setup_section(scrollable_frame)
-        self.create_action_buttons(scrollable_frame)
+        self._built = True
+        for builder in self._pending_sections:
+            builder(self.scrollable_frame)
+        self._pending_sections = []
         
         # Load current settings
         self.load_settings()
+        self.frame.after_idle(self._maybe_flatten_scroll)
+        
+        # Probe PHP and WP-CLI only once the user actually looks at them
+        if not self._probes_done:
+            self._probes_done = True
+            self.check_php_installation()
+            self.check_wp_cli_status()
     
-    def create_xampp_settings(self, parent):
-        """Create XAMPP configuration section"""
-        if MODERN_UI:
-            xampp_frame = ttk.Labelframe(parent, text="📁 XAMPP Configuration", bootstyle="primary")
-        else:
-            xampp_frame = ttk.Labelframe(parent, text="📁 XAMPP Configuration")
-        xampp_frame.grid(row=0, column=0, columnspan=2, sticky="ew", padx=5, pady=5)
-        xampp_frame.columnconfigure(1, weight=1)
-        
-        # XAMPP htdocs path
-        ttk.Label(xampp_frame, text="XAMPP htdocs Path:").grid(row=0, column=0, sticky="w", padx=5, pady=2)
-        self.htdocs_path = ttk.Entry(xampp_frame, font=("Segoe UI", 9))
-        self.htdocs_path.grid(row=0, column=1, sticky="ew", padx=5, pady=2)
-        ttk.Button(xampp_frame, text="📁", command=lambda: self.browse_folder(self.htdocs_path)).grid(row=0, column=2, padx=2)
-    
-    def create_mysql_settings(self, parent):
-        """Create MySQL configuration section"""
-        if MODERN_UI:
-            mysql_frame = ttk.Labelframe(parent, text="🗄️ MySQL Configuration", bootstyle="success")
-        else:
-            mysql_frame = ttk.Labelframe(parent, text="🗄️ MySQL Configuration")
-        mysql_frame.grid(row=1, column=0, columnspan=2, sticky="ew", padx=5, pady=5)
-        mysql_frame.columnconfigure(1, weight=1)
-        
-        # MySQL settings
-        ttk.Label(mysql_frame, text="MySQL Host:").grid(row=0, column=0, sticky="w", padx=5, pady=2)
-        self.mysql_host = ttk.Entry(mysql_frame, font=("Segoe UI", 9))
-        self.mysql_host.grid(row=0, column=1, sticky="ew", padx=5, pady=2)
-        
-        ttk.Label(mysql_frame, text="MySQL User:").grid(row=1, column=0, sticky="w", padx=5, pady=2)
-        self.mysql_user = ttk.Entry(mysql_frame, font=("Segoe UI", 9))
-        self.mysql_user.grid(row=1, column=1, sticky="ew", padx=5, pady=2)
-        
-        ttk.Label(mysql_frame, text="MySQL Password:").grid(row=2, column=0, sticky="w", padx=5, pady=2)
-        self.mysql_password = ttk.Entry(mysql_frame, show="*", font=("Segoe UI", 9))
-        self.mysql_password.grid(row=2, column=1, sticky="ew", padx=5, pady=2)
-    
-    def create_wordpress_settings(self, parent):
-        """Create WordPress defaults section"""
-        if MODERN_UI:
-            wp_frame = ttk.Labelframe(parent, text="🌐 WordPress Defaults", bootstyle="warning")
-        else:
-            wp_frame = ttk.Labelframe(parent, text="🌐 WordPress Defaults")
-        wp_frame.grid(row=2, column=0, columnspan=2, sticky="ew", padx=5, pady=5)
-        wp_frame.columnconfigure(1, weight=1)
-        
-        # WordPress settings
-        ttk.Label(wp_frame, text="Admin Username:").grid(row=0, column=0, sticky="w", padx=5, pady=2)
-        self.admin_user = ttk.Entry(wp_frame, font=("Segoe UI", 9))
-        self.admin_user.grid(row=0, column=1, sticky="ew", padx=5, pady=2)
-        
-        ttk.Label(wp_frame, text="Admin Password:").grid(row=1, column=0, sticky="w", padx=5, pady=2)
-        self.admin_password = ttk.Entry(wp_frame, show="*", font=("Segoe UI", 9))
-        self.admin_password.grid(row=1, column=1, sticky="ew", padx=5, pady=2)
-        
-        ttk.Label(wp_frame, text="Admin Email:").grid(row=2, column=0, sticky="w", padx=5, pady=2)
-        self.admin_email = ttk.Entry(wp_frame, font=("Segoe UI", 9))
-        self.admin_email.grid(row=2, column=1, sticky="ew", padx=5, pady=2)
-        
-        ttk.Label(wp_frame, text="Base URL:").grid(row=3, column=0, sticky="w", padx=5, pady=2)
-        self.base_url = ttk.Entry(wp_frame, font=("Segoe UI", 9))
-        self.base_url.grid(row=3, column=1, sticky="ew", padx=5, pady=2)
-        
-        # WordPress ZIP file management
-        ttk.Label(wp_frame, text="WordPress ZIP:").grid(row=4, column=0, sticky="w", padx=5, pady=2)
-        zip_frame = ttk.Frame(wp_frame)
-        zip_frame.grid(row=4, column=1, sticky="ew", padx=5, pady=2)
-        zip_frame.columnconfigure(0, weight=1)
-        
-        self.wp_zip_path = ttk.Entry(zip_frame, font=("Segoe UI", 9))
-        self.wp_zip_path.grid(row=0, column=0, sticky="ew", padx=2)
-        
-        if MODERN_UI:
-            upload_btn = ttk.Button(zip_frame, text="📤 Upload New", 
-                                  bootstyle="primary-outline", command=self.upload_wordpress_zip)
-        else:
-            upload_btn = ttk.Button(zip_frame, text="📤 Upload New", command=self.upload_wordpress_zip)
-        upload_btn.grid(row=0, column=1, padx=2)
+    def create_config_sections(self, parent):
+        """Create the XAMPP, MySQL, WordPress and WP-CLI sections"""
+        for row, spec in enumerate(self.SECTIONS):
+            self._build_section(parent, row, spec)
     
-    def create_wpcli_settings(self, parent):
-        """Create WP-CLI configuration section"""
-        if MODERN_UI:
-            wpcli_frame = ttk.Labelframe(parent, text="⚡ WP-CLI Configuration", bootstyle="danger")
-        else:
-            wpcli_frame = ttk.Labelframe(parent, text="⚡ WP-CLI Configuration")
-        wpcli_frame.grid(row=3, column=0, columnspan=2, sticky="ew", padx=5, pady=5)
-        wpcli_frame.columnconfigure(1, weight=1)
-        
-        ttk.Label(wpcli_frame, text="WP-CLI Path:").grid(row=0, column=0, sticky="w", padx=5, pady=2)
-        self.wpcli_path = ttk.Entry(wpcli_frame, font=("Segoe UI", 9))
-        self.wpcli_path.grid(row=0, column=1, sticky="ew", padx=5, pady=2)
-        ttk.Button(wpcli_frame, text="📁", command=lambda: self.browse_file(self.wpcli_path)).grid(row=0, column=2, padx=2)
+    def _build_section(self, parent, row, spec):
+        """Create one labelled section of Label/Entry rows from a SECTIONS entry"""
+        title, style, fields = spec
+        section_frame = _labelframe(parent, title, style)
+        section_frame.grid(row=row, column=0, columnspan=2, sticky="ew", padx=5, pady=5)
+        section_frame.columnconfigure(1, weight=1)
+        
+        for field_row, (key, label, kind) in enumerate(fields):
+            ttk.Label(section_frame, text=label).grid(row=field_row, column=0, sticky="w", padx=5, pady=2)
+            var = self._vars[key] = tk.StringVar()
+            
+            if kind == 'zip':
+                # Entry plus upload button share one cell
+                zip_frame = ttk.Frame(section_frame)
+                zip_frame.grid(row=field_row, column=1, sticky="ew", padx=5, pady=2)
+                zip_frame.columnconfigure(0, weight=1)
+                entry = ttk.Entry(zip_frame, textvariable=var, font=self._entry_font)
+                entry.grid(row=0, column=0, sticky="ew", padx=2)
+                upload_btn = _button(zip_frame, "📤 Upload New", "primary-outline", self.upload_wordpress_zip)
+                upload_btn.grid(row=0, column=1, padx=2)
+            else:
+                show = "*" if kind == 'password' else ""
+                entry = ttk.Entry(section_frame, textvariable=var, show=show, font=self._entry_font)
+                entry.grid(row=field_row, column=1, sticky="ew", padx=5, pady=2)
+            
+            if kind == 'folder':
+                ttk.Button(section_frame, text="📁",
+                           command=lambda e=entry: self.browse_folder(e)).grid(row=field_row, column=2, padx=2)
+            elif kind == 'file':
+                ttk.Button(section_frame, text="📁",
+                           command=lambda e=entry: self.browse_file(e)).grid(row=field_row, column=2, padx=2)
+            
+            setattr(self, key, entry)
     
     def create_action_buttons(self, parent):
         """Create action buttons"""
         button_frame = ttk.Frame(parent)
         button_frame.grid(row=4, column=0, columnspan=2, pady=20)
         
-        if MODERN_UI:
-            load_btn = ttk.Button(button_frame, text="🔄 Load Current Settings", 
-                                bootstyle="info", command=self.load_settings)
-            save_btn = ttk.Button(button_frame, text="💾 Save Settings", 
-                                bootstyle="success", command=self.save_settings)
-            reset_btn = ttk.Button(button_frame, text="🔙 Reset to Defaults", 
-                                 bootstyle="warning", command=self.reset_settings)
-        else:
-            load_btn = ttk.Button(button_frame, text="🔄 Load Current Settings", command=self.load_settings)
-            save_btn = ttk.Button(button_frame, text="💾 Save Settings", command=self.save_settings)
-            reset_btn = ttk.Button(button_frame, text="🔙 Reset to Defaults", command=self.reset_settings)
+        load_btn = _button(button_frame, "🔄 Load Current Settings", "info", self.load_settings)
+        save_btn = _button(button_frame, "💾 Save Settings", "success", self.save_settings)
+        reset_btn = _button(button_frame, "🔙 Reset to Defaults", "warning", self.reset_settings)
         
         load_btn.pack(side="left", padx=5)
         save_btn.pack(side="left", padx=5)
@@ -227,73 +300,58 @@ class SettingsTab:
             entry_widget.insert(0, file_path)
     
     def load_settings(self):
-        """Load current settings into the form"""
-        try:
-            # XAMPP settings
-            self.htdocs_path.delete(0, tk.END)
-            self.htdocs_path.insert(0, config_manager.get('xampp.htdocs_path', ''))
-            
-            # MySQL settings
-            self.mysql_host.delete(0, tk.END)
-            self.mysql_host.insert(0, config_manager.get('xampp.mysql_host', 'localhost'))
-            
-            self.mysql_user.delete(0, tk.END)
-            self.mysql_user.insert(0, config_manager.get('xampp.mysql_user', 'root'))
-            
-            self.mysql_password.delete(0, tk.END)
-            self.mysql_password.insert(0, config_manager.get('xampp.mysql_password', ''))
-            
-            # WordPress settings
-            self.admin_user.delete(0, tk.END)
-            self.admin_user.insert(0, config_manager.get('wordpress.admin_user', 'admin'))
-            
-            self.admin_password.delete(0, tk.END)
-            self.admin_password.insert(0, config_manager.get('wordpress.admin_password', ''))
-            
-            self.admin_email.delete(0, tk.END)
-            self.admin_email.insert(0, config_manager.get('wordpress.admin_email', ''))
-            
-            self.base_url.delete(0, tk.END)
-            self.base_url.insert(0, config_manager.get('wordpress.base_url', 'http://localhost'))
-            
-            # WordPress ZIP path
-            self.wp_zip_path.delete(0, tk.END)
-            # WordPress ZIP file path (show relative path for display)
-            default_zip_path = "assets/wordpress-6.8.2.zip"
-            stored_path = config_manager.get('wordpress.zip_path', default_zip_path)
-            
-            # If stored path is absolute, convert to relative for display
-            display_path = PathUtils.make_relative_to_app(stored_path)
-            self.wp_zip_path.insert(0, display_path)
-            
-            # WP-CLI settings
-            self.wpcli_path.delete(0, tk.END)
-            # Try to get current WP-CLI path
-            wpcli_path = getattr(self.main_window.wp_installer, 'wp_cli_command', ['wp'])
-            if isinstance(wpcli_path, list) and len(wpcli_path) > 1:
-                self.wpcli_path.insert(0, ' '.join(wpcli_path))
-            else:
-                self.wpcli_path.insert(0, 'wp')
-            
-            logger.info("Settings loaded successfully")
-            
-        except Exception as e:
-            logger.error(f"Failed to load settings: {e}")
-            self.main_window.toast_manager.show_toast(f"Failed to load settings: {e}", "error")
+        """Load current settings into the form (config is read on the worker thread)"""
+        def read_and_apply():
+            try:
+                snapshot = self._read_config_snapshot()
+            except Exception as e:
+                logger.error(f"Failed to load settings: {e}")
+                self._on_ui(self.main_window.toast_manager.show_toast,
+                            f"Failed to load settings: {e}", "error")
+                return
+            self._on_ui(self._apply_config_snapshot, snapshot)
+        
+        self._worker_q.put(read_and_apply)
+    
+    def _read_config_snapshot(self):
+        """Collect form values from the config as a plain dict (no Tk calls)"""
+        # Read the config tree once and index sections locally
+        cfg = config_manager.config
+        sections = {}
+        snapshot = {}
+        for key, section, option, default in self._FIELDS:
+            if section not in sections:
+                sections[section] = cfg.get(section) or {}
+            snapshot[key] = sections[section].get(option, default)
+        
+        # WordPress ZIP file path (show relative path for display)
+        default_zip_path = "assets/wordpress-6.8.2.zip"
+        stored_path = sections['wordpress'].get('zip_path', default_zip_path)
+        snapshot['wp_zip_path'] = self._fast_relative(stored_path)
+        
+        # Try to get current WP-CLI path (may create the installer)
+        wpcli_path = getattr(self.main_window.wp_installer, 'wp_cli_command', ['wp'])
+        if isinstance(wpcli_path, list) and len(wpcli_path) > 1:
+            snapshot['wpcli_path'] = ' '.join(wpcli_path)
+        else:
+            snapshot['wpcli_path'] = 'wp'
+        
+        return snapshot
+    
+    def _apply_config_snapshot(self, snapshot):
+        """Fill the form from a config snapshot (Tk thread)"""
+        for key, value in snapshot.items():
+            self._vars[key].set(value)
+        logger.info("Settings loaded successfully")
     
     def save_settings(self):
         """Save settings from form"""
         try:
-            # Update configuration
-            config_manager.set('xampp.htdocs_path', self.htdocs_path.get())
-            config_manager.set('xampp.mysql_host', self.mysql_host.get())
-            config_manager.set('xampp.mysql_user', self.mysql_user.get())
-            config_manager.set('xampp.mysql_password', self.mysql_password.get())
-            
-            config_manager.set('wordpress.admin_user', self.admin_user.get())
-            config_manager.set('wordpress.admin_password', self.admin_password.get())
-            config_manager.set('wordpress.admin_email', self.admin_email.get())
-            config_manager.set('wordpress.base_url', self.base_url.get())
+            # Update configuration in one merge
+            updates = {}
+            for key, section, option, _ in self._FIELDS:
+                updates.setdefault(section, {})[option] = self._vars[key].get()
+            config_manager.update(updates)
             
             # Save configuration
             if config_manager.save_config():
@@ -304,7 +362,7 @@ class SettingsTab:
                 self.main_window._wp_installer = None
                 
                 # Test connections with new settings
-                threading.Thread(target=self.main_window.test_connections, daemon=True).start()
+                self._worker_q.put(self.main_window.test_connections)
             else:
                 self.main_window.toast_manager.show_toast("Failed to save settings", "error")
                 
@@ -314,20 +372,23 @@ class SettingsTab:
     
     def reset_settings(self):
         """Reset settings to defaults"""
-        if messagebox.askyesno("Reset Settings", "Reset all settings to default values?"):
-            try:
-                # Load default configuration
-                default_config = config_manager.get_default_config()
-                config_manager.config = default_config
-                
-                # Reload the form
-                self.load_settings()
-                
-                self.main_window.toast_manager.show_toast("Settings reset to defaults", "success")
-                
-            except Exception as e:
-                logger.error(f"Failed to reset settings: {e}")
-                self.main_window.toast_manager.show_toast(f"Failed to reset settings: {e}", "error")
+        self.main_window.confirm("Reset Settings", "Reset all settings to default values?", self._do_reset)
+    
+    def _do_reset(self):
+        """Load the default configuration into the form"""
+        try:
+            # Load default configuration
+            default_config = config_manager.get_default_config()
+            config_manager.config = default_config
+            
+            # Reload the form
+            self.load_settings()
+            
+            self.main_window.toast_manager.show_toast("Settings reset to defaults", "success")
+        
+        except Exception as e:
+            logger.error(f"Failed to reset settings: {e}")
+            self.main_window.toast_manager.show_toast(f"Failed to reset settings: {e}", "error")
     
     def upload_wordpress_zip(self):
         """Upload a new WordPress ZIP file"""
@@ -335,7 +396,7 @@ class SettingsTab:
             # Select new WordPress ZIP file
             file_path = filedialog.askopenfilename(
                 title="Select WordPress ZIP File",
-                filetypes=[("ZIP files", "*.zip"), ("All files", "*.*")],
+                filetypes=self._ZIP_FILETYPES,
                 defaultextension=".zip"
             )
             
@@ -345,10 +406,17 @@ class SettingsTab:
             # Validate that it's a valid ZIP file
             try:
                 with zipfile.ZipFile(file_path, 'r') as zip_ref:
-                    # Check if it contains WordPress files
-                    file_list = zip_ref.namelist()
-                    has_wp_config = any('wp-config-sample.php' in f for f in file_list)
-                    has_wp_admin = any('wp-admin/' in f for f in file_list)
+                    # Check if it contains WordPress files (stop at the first hit of both)
+                    has_wp_config = has_wp_admin = False
+                    for info in zip_ref.infolist():
+                        match = _WP_MARKER.search(info.filename)
+                        if match:
+                            if match.group(1):
+                                has_wp_admin = True
+                            else:
+                                has_wp_config = True
+                            if has_wp_config and has_wp_admin:
+                                break
                     
                     if not (has_wp_config and has_wp_admin):
                         messagebox.showerror("Invalid File", 
@@ -360,30 +428,33 @@ class SettingsTab:
                 messagebox.showerror("Invalid File", "The selected file is not a valid ZIP archive.")
                 return
             
-            # Get the target assets directory using helper
-            from ...utils.paths import PathUtils
-            assets_dir = PathUtils.get_app_data_dir("assets")
-            
-            # Use the expected filename
-            target_path = assets_dir / "wordpress-6.8.2.zip"
-            
             # Confirm overwrite if file exists
-            if target_path.exists():
-                if not messagebox.askyesno("Overwrite File", 
-                                         f"Replace existing WordPress file?\n{target_path}"):
-                    return
+            if os.path.lexists(self._wp_zip_target):
+                self.main_window.confirm("Overwrite File",
+                              f"Replace existing WordPress file?\n{self._wp_zip_target}",
+                              lambda: self._store_wordpress_zip(file_path))
+            else:
+                self._store_wordpress_zip(file_path)
+        
+        except Exception as e:
+            logger.error(f"Failed to upload WordPress ZIP: {e}")
+            self.main_window.toast_manager.show_toast(f"Failed to upload WordPress ZIP: {e}", "error")
+    
+    def _store_wordpress_zip(self, file_path):
+        """Copy the chosen ZIP into assets and point the config at it"""
+        try:
+            target_path = self._wp_zip_target
             
             # Copy the file
-            shutil.copy2(file_path, target_path)
+            Helpers.fast_copy(file_path, target_path)
             
             # Update the entry field with relative path
-            relative_path = PathUtils.make_relative_to_app(str(target_path))
-            self.wp_zip_path.delete(0, tk.END)
-            self.wp_zip_path.insert(0, relative_path)
+            relative_path = self._wp_zip_target_relative
+            self._vars['wp_zip_path'].set(relative_path)
             
-            # Update configuration with relative path
-            config_manager.set('wordpress.zip_path', relative_path)
-            config_manager.save_config()
+            # Update configuration with relative path (re-uploads usually change nothing)
+            if relative_path != config_manager.get('wordpress.zip_path'):
+                config_manager.set('wordpress.zip_path', relative_path, persist=True)
             
             logger.success(f"WordPress ZIP file updated: {target_path}")
             self.main_window.toast_manager.show_toast("WordPress ZIP file updated successfully!", "success")
@@ -403,7 +474,7 @@ class SettingsTab:
         
         # PHP status
         ttk.Label(php_frame, text="PHP Status:").grid(row=0, column=0, sticky="w", padx=(0, 10))
-        self.php_status_var = tk.StringVar(value="Checking...")
+        self.php_status_var = tk.StringVar(value="Not checked")
         self.php_status_label = ttk.Label(php_frame, textvariable=self.php_status_var)
         self.php_status_label.grid(row=0, column=1, sticky="w")
         
@@ -415,9 +486,6 @@ class SettingsTab:
         self.setup_php_btn = ttk.Button(php_frame, text="Setup PHP Path", command=self.setup_php_path)
         self.setup_php_btn.grid(row=1, column=1, pady=(5, 0))
         self.setup_php_btn.grid_remove()  # Hide initially
-        
-        # Check PHP on startup
-        self.main_window.root.after(100, self.check_php_installation)
     
     def create_wpcli_setup_section(self, parent):
         """Create WP-CLI setup section"""
@@ -430,100 +498,118 @@ class SettingsTab:
         
         # WP-CLI status
         ttk.Label(wpcli_frame, text="WP-CLI Status:").grid(row=0, column=0, sticky="w", padx=(0, 10))
-        self.wpcli_status_var = tk.StringVar(value="Checking...")
+        self.wpcli_status_var = tk.StringVar(value="Not checked")
         self.wpcli_status_label = ttk.Label(wpcli_frame, textvariable=self.wpcli_status_var)
         self.wpcli_status_label.grid(row=0, column=1, sticky="w")
         
         # Install WP-CLI button
         self.install_wpcli_btn = ttk.Button(wpcli_frame, text="Auto-Install WP-CLI", command=self.install_wp_cli)
         self.install_wpcli_btn.grid(row=1, column=1, pady=(5, 0))
-        
-        # Check WP-CLI on startup
-        self.main_window.root.after(200, self.check_wp_cli_status)
     
     def check_php_installation(self):
         """Check if PHP is accessible"""
         self.php_status_var.set("Checking...")
         self.check_php_btn.configure(state="disabled")
-        
-        def check_php():
-            try:
-                is_available, message = Helpers.check_php_installation()
-                if is_available:
-                    self.php_status_var.set(f"✓ {message}")
-                    self.setup_php_btn.grid_remove()
-                else:
-                    self.php_status_var.set(f"✗ {message}")
-                    self.setup_php_btn.grid()
-            except Exception as e:
-                self.php_status_var.set(f"✗ Error: {e}")
-                self.setup_php_btn.grid()
-            finally:
-                self.check_php_btn.configure(state="normal")
-        
-        # Run in thread to avoid blocking UI
-        threading.Thread(target=check_php, daemon=True).start()
+        self._submit_probe(self._probe_php, self._apply_php_status)
+    
+    def _submit_probe(self, probe, apply):
+        """Run a status probe on the pool and hand its result to the Tk thread"""
+        future = self._probe_pool.submit(probe)
+        future.add_done_callback(lambda f: self._on_ui(apply, *f.result()))
+    
+    @staticmethod
+    def _probe_php():
+        """Return (is_available, status text) for the PHP check"""
+        try:
+            is_available, message = Helpers.check_php_installation()
+            return is_available, f"✓ {message}" if is_available else f"✗ {message}"
+        except Exception as e:
+            return False, f"✗ Error: {e}"
+    
+    def _apply_php_status(self, is_available, status):
+        """Show the PHP check result (Tk thread)"""
+        self.php_status_var.set(status)
+        if is_available:
+            self.setup_php_btn.grid_remove()
+        else:
+            self.setup_php_btn.grid()
+        self.check_php_btn.configure(state="normal")
     
     def setup_php_path(self):
         """Setup PHP path in system variables"""
         php_exe = filedialog.askopenfilename(
             title="Select PHP executable (php.exe)",
-            filetypes=[("PHP Executable", "php.exe"), ("All Files", "*.*")]
+            filetypes=self._PHP_FILETYPES
         )
         
         if php_exe:
+            # Block re-entry until this PATH update has finished
+            self.setup_php_btn.configure(state="disabled")
+            
+            def enable_button():
+                self.setup_php_btn.configure(state="normal")
+            
             def setup_php():
                 try:
                     if Helpers.setup_php_path(php_exe):
-                        self.main_window.root.after(0, lambda: self.main_window.toast_manager.show_toast(
-                            "PHP path added to system variables successfully!", "success"))
+                        self._on_ui(self.main_window.toast_manager.show_toast,
+                                    "PHP path added to system variables successfully!", "success")
                         # Recheck PHP installation
-                        self.main_window.root.after(1000, self.check_php_installation)
+                        self._on_ui(self.main_window.root.after, 1000, self.check_php_installation)
                     else:
-                        self.main_window.root.after(0, lambda: self.main_window.toast_manager.show_toast(
-                            "Failed to add PHP path to system variables", "error"))
+                        self._on_ui(self.main_window.toast_manager.show_toast,
+                                    "Failed to add PHP path to system variables", "error")
                 except Exception as e:
-                    self.main_window.root.after(0, lambda: self.main_window.toast_manager.show_toast(
-                        f"Error setting up PHP: {e}", "error"))
+                    self._on_ui(self.main_window.toast_manager.show_toast,
+                                f"Error setting up PHP: {e}", "error")
+                finally:
+                    self._on_ui(enable_button)
             
-            threading.Thread(target=setup_php, daemon=True).start()
+            self._worker_q.put(setup_php)
     
     def check_wp_cli_status(self):
         """Check WP-CLI installation status"""
         self.wpcli_status_var.set("Checking...")
-        
-        def check_wpcli():
-            try:
-                wp_cli = Helpers.find_wp_cli_executable()
-                if wp_cli:
-                    self.wpcli_status_var.set("✓ WP-CLI found and working")
-                    self.install_wpcli_btn.configure(text="WP-CLI Already Installed", state="disabled")
-                else:
-                    self.wpcli_status_var.set("✗ WP-CLI not found")
-                    self.install_wpcli_btn.configure(text="Auto-Install WP-CLI", state="normal")
-            except Exception as e:
-                self.wpcli_status_var.set(f"✗ Error: {e}")
-        
-        threading.Thread(target=check_wpcli, daemon=True).start()
+        self._submit_probe(self._probe_wpcli, self._apply_wpcli_status)
+    
+    @staticmethod
+    def _probe_wpcli():
+        """Return (found, status text) for the WP-CLI check"""
+        try:
+            found = bool(Helpers.find_wp_cli_executable())
+            return found, "✓ WP-CLI found and working" if found else "✗ WP-CLI not found"
+        except Exception as e:
+            return None, f"✗ Error: {e}"
+    
+    def _apply_wpcli_status(self, found, status):
+        """Show the WP-CLI check result (Tk thread)"""
+        self.wpcli_status_var.set(status)
+        if found:
+            self.install_wpcli_btn.configure(text="WP-CLI Already Installed", state="disabled")
+        elif found is not None:
+            self.install_wpcli_btn.configure(text="Auto-Install WP-CLI", state="normal")
     
     def install_wp_cli(self):
         """Install WP-CLI automatically"""
         self.install_wpcli_btn.configure(state="disabled", text="Installing...")
         
+        def reset_button():
+            self.install_wpcli_btn.configure(state="normal", text="Auto-Install WP-CLI")
+        
         def install_wpcli():
             try:
                 if Helpers.install_wp_cli():
-                    self.main_window.root.after(0, lambda: self.main_window.toast_manager.show_toast(
-                        "WP-CLI installed successfully!", "success"))
+                    self._on_ui(self.main_window.toast_manager.show_toast,
+                                "WP-CLI installed successfully!", "success")
                     # Recheck WP-CLI status
-                    self.main_window.root.after(1000, self.check_wp_cli_status)
+                    self._on_ui(self.main_window.root.after, 1000, self.check_wp_cli_status)
                 else:
-                    self.main_window.root.after(0, lambda: self.main_window.toast_manager.show_toast(
-                        "Failed to install WP-CLI", "error"))
-                    self.install_wpcli_btn.configure(state="normal", text="Auto-Install WP-CLI")
+                    self._on_ui(self.main_window.toast_manager.show_toast,
+                                "Failed to install WP-CLI", "error")
+                    self._on_ui(reset_button)
             except Exception as e:
-                self.main_window.root.after(0, lambda: self.main_window.toast_manager.show_toast(
-                    f"Error installing WP-CLI: {e}", "error"))
-                self.install_wpcli_btn.configure(state="normal", text="Auto-Install WP-CLI")
+                self._on_ui(self.main_window.toast_manager.show_toast,
+                            f"Error installing WP-CLI: {e}", "error")
+                self._on_ui(reset_button)
         
-        threading.Thread(target=install_wpcli, daemon=True).start()
+        self._worker_q.put(install_wpcli)
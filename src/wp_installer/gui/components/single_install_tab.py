@@ -4,22 +4,27 @@ Single Installation Tab Component
 Handles single WordPress site installation
 """
 
-import threading
 import tkinter as tk
-from pathlib import Path
-from tkinter import messagebox
 
-try:
-    import ttkbootstrap as ttk
-    MODERN_UI = True
-except ImportError:
-    import tkinter.ttk as ttk
-    MODERN_UI = False
+from . import ttk, MODERN_UI
 
 from ...utils.logger import logger
 from ...utils.config import config_manager
 
+# bootstyle keyword arguments per widget role, resolved once for the active theme
+_BOOTSTYLES = {'tab': "light", 'header': "primary", 'form': "info", 'install': "success"}
+STYLE = {role: ({'bootstyle': style} if MODERN_UI else {}) for role, style in _BOOTSTYLES.items()}
+
+# Site name characters that are not valid in a database name
+_DBNAME_TRANS = str.maketrans({'-': '_', ' ': '_'})
+
+# Themes offered in the theme picker
+_THEME_VALUES = ("twentytwentyfour", "twentytwentythree", "twentytwentytwo", "astra", "generatepress")
+
 class SingleInstallTab:
+    __slots__ = ('main_window', 'notebook', 'frame', 'site_name', 'site_title', 'db_name',
+                 'theme', 'install_btn', '_db_after_id', '_db_name_auto', '_db_name_dirty')
+    
     def __init__(self, main_window, notebook):
         self.main_window = main_window
         self.notebook = notebook
@@ -29,10 +34,7 @@ class SingleInstallTab:
     
     def create_tab(self):
         """Create single WordPress installation tab"""
-        if MODERN_UI:
-            self.frame = ttk.Frame(self.notebook, bootstyle="light")
-        else:
-            self.frame = ttk.Frame(self.notebook)
+        self.frame = ttk.Frame(self.notebook, **STYLE['tab'])
         self.notebook.add(self.frame, text="🏠 Single Install")
         
         # Configure grid
@@ -47,20 +49,13 @@ class SingleInstallTab:
     
     def create_header(self):
         """Create tab header"""
-        if MODERN_UI:
-            header_label = ttk.Label(self.frame, text="Single WordPress Installation", 
-                                   font=("Segoe UI", 14, "bold"), bootstyle="primary")
-        else:
-            header_label = ttk.Label(self.frame, text="Single WordPress Installation", 
-                                   font=("Segoe UI", 14, "bold"))
+        header_label = ttk.Label(self.frame, text="Single WordPress Installation", 
+                               font=("Segoe UI", 14, "bold"), **STYLE['header'])
         header_label.grid(row=0, column=0, pady=10)
     
     def create_installation_form(self):
         """Create form for single installation"""
-        if MODERN_UI:
-            form_frame = ttk.Labelframe(self.frame, text="📝 Site Configuration", bootstyle="info")
-        else:
-            form_frame = ttk.Labelframe(self.frame, text="📝 Site Configuration")
+        form_frame = ttk.Labelframe(self.frame, text="📝 Site Configuration", **STYLE['form'])
         form_frame.grid(row=1, column=0, sticky="ew", padx=20, pady=10)
         form_frame.columnconfigure(1, weight=1)
         
@@ -80,57 +75,93 @@ class SingleInstallTab:
         ttk.Label(form_frame, text="Database Name:").grid(row=2, column=0, sticky="w", padx=5, pady=5)
         self.db_name = ttk.Entry(form_frame, font=("Segoe UI", 10))
         self.db_name.grid(row=2, column=1, sticky="ew", padx=5, pady=5)
+        ttk.Button(form_frame, text="↺", width=3,
+                   command=self.reset_db_name).grid(row=2, column=2, padx=(0, 5))
         
-        # Auto-generate database name based on site name
-        def update_db_name(*args):
-            site_name = self.site_name.get().replace('-', '_').replace(' ', '_')
-            self.db_name.delete(0, tk.END)
-            self.db_name.insert(0, f"wp_{site_name}")
-        
-        self.site_name.bind('<KeyRelease>', update_db_name)
-        update_db_name()  # Initial update
+        # Auto-generate database name based on site name (debounced while typing)
+        # until the user types their own database name
+        self._db_after_id = None
+        self._db_name_auto = ""
+        self._db_name_dirty = False
+        self.db_name.bind('<KeyRelease>', self._check_db_name_edited)
+        self.site_name.bind('<KeyRelease>', self._schedule_db_name_update)
+        self.site_name.bind('<Return>', self.update_db_name, add="+")
+        self.site_name.bind('<FocusOut>', self.update_db_name, add="+")
+        self.update_db_name()  # Initial update
         
         # Theme selection
         ttk.Label(form_frame, text="Theme:").grid(row=3, column=0, sticky="w", padx=5, pady=5)
-        self.theme = ttk.Combobox(form_frame, values=[
-            "twentytwentyfour", "twentytwentythree", "twentytwentytwo", "astra", "generatepress"
-        ], font=("Segoe UI", 10))
+        self.theme = ttk.Combobox(form_frame, values=_THEME_VALUES, font=("Segoe UI", 10))
         self.theme.grid(row=3, column=1, sticky="ew", padx=5, pady=5)
         self.theme.set("twentytwentyfour")
         
         # Install button
-        if MODERN_UI:
-            install_btn = ttk.Button(form_frame, text="🚀 Install WordPress", 
-                                   bootstyle="success", command=self.install_site)
-        else:
-            install_btn = ttk.Button(form_frame, text="🚀 Install WordPress", 
-                                   command=self.install_site)
-        install_btn.grid(row=4, column=0, columnspan=2, pady=20)
+        self.install_btn = ttk.Button(form_frame, text="🚀 Install WordPress", 
+                                    command=self.install_site, **STYLE['install'])
+        self.install_btn.grid(row=4, column=0, columnspan=2, pady=20)
+    
+    def _check_db_name_edited(self, event=None):
+        """Stop auto-filling once the database name differs from the generated one"""
+        self._db_name_dirty = self.db_name.get() != self._db_name_auto
+    
+    def reset_db_name(self):
+        """Go back to the database name generated from the site name"""
+        self._db_name_dirty = False
+        self.update_db_name()
+    
+    def _schedule_db_name_update(self, event=None):
+        """Restart the db name timer so a burst of keystrokes updates once"""
+        if self._db_name_dirty:
+            return
+        if self._db_after_id is not None:
+            self.frame.after_cancel(self._db_after_id)
+        self._db_after_id = self.frame.after(250, self.update_db_name)
+    
+    def update_db_name(self, event=None):
+        """Derive the database name from the site name"""
+        if self._db_after_id is not None:
+            self.frame.after_cancel(self._db_after_id)
+            self._db_after_id = None
+        if self._db_name_dirty:
+            return
+        self._db_name_auto = 'wp_' + self.site_name.get().translate(_DBNAME_TRANS)
+        self.db_name.delete(0, tk.END)
+        self.db_name.insert(0, self._db_name_auto)
     
     def install_site(self):
         """Install a single WordPress site"""
+        # Read and validate the form on the Tk thread
+        site_name = self.site_name.get().strip()
+        site_title = self.site_title.get().strip()
+        db_name = self.db_name.get().strip()
+        theme = self.theme.get()
+        
+        if not all([site_name, site_title, db_name]):
+            self.main_window.toast_manager.show_toast("Please fill in all required fields", "error")
+            return
+        
+        # Check if site already exists
+        htdocs_path = config_manager.get_htdocs_path()
+        if (htdocs_path / site_name).exists():
+            self.main_window.confirm("Site Exists",
+                                     f"Site '{site_name}' already exists. Replace it?",
+                                     lambda: self._start_install(site_name, site_title, db_name, theme, True))
+        else:
+            self._start_install(site_name, site_title, db_name, theme, False)
+    
+    def _start_install(self, site_name, site_title, db_name, theme, replace_existing):
+        """Queue the install job for a validated form"""
+        logger.info(f"Starting installation of '{site_name}'...")
+        self.main_window.update_status(f"Installing {site_name}...")
+        self.install_btn.configure(state="disabled")
+        
+        on_ui = self.main_window.root.after
+        toast = self.main_window.toast_manager.show_toast
+        update_status = self.main_window.update_status
+        
         def install():
             try:
-                site_name = self.site_name.get().strip()
-                site_title = self.site_title.get().strip()
-                db_name = self.db_name.get().strip()
-                theme = self.theme.get()
-                
-                if not all([site_name, site_title, db_name]):
-                    self.main_window.toast_manager.show_toast("Please fill in all required fields", "error")
-                    return
-                
-                logger.info(f"Starting installation of '{site_name}'...")
-                self.main_window.update_status(f"Installing {site_name}...")
-                
-                # Check if site already exists
-                htdocs_path = Path(config_manager.get('xampp.htdocs_path'))
-                site_path = htdocs_path / site_name
-                
-                if site_path.exists():
-                    if not messagebox.askyesno("Site Exists", 
-                                             f"Site '{site_name}' already exists. Replace it?"):
-                        return
+                if replace_existing:
                     self.main_window.wp_installer.delete_site(site_name)
                 
                 # Create the site
@@ -142,18 +173,20 @@ class SingleInstallTab:
                 )
                 
                 if success:
-                    self.main_window.toast_manager.show_toast(f"Site '{site_name}' installed successfully!", "success")
-                    self.main_window.update_status("Ready")
+                    on_ui(0, toast, f"Site '{site_name}' installed successfully!", "success")
+                    on_ui(0, update_status, "Ready")
                     # Refresh sites list if management tab exists
                     if hasattr(self.main_window, 'management_tab'):
-                        self.main_window.management_tab.refresh_sites_list()
+                        on_ui(0, self.main_window.management_tab.refresh_sites_list)
                 else:
-                    self.main_window.toast_manager.show_toast(f"Failed to install '{site_name}'", "error")
-                    self.main_window.update_status("Installation failed")
+                    on_ui(0, toast, f"Failed to install '{site_name}'", "error")
+                    on_ui(0, update_status, "Installation failed")
                     
             except Exception as e:
                 logger.error(f"Installation error: {e}")
-                self.main_window.toast_manager.show_toast(f"Installation error: {e}", "error")
-                self.main_window.update_status("Error")
+                on_ui(0, toast, f"Installation error: {e}", "error")
+                on_ui(0, update_status, "Error")
+            finally:
+                on_ui(0, lambda: self.install_btn.configure(state="normal"))
         
-        threading.Thread(target=install, daemon=True).start()
+        self.main_window.install_executor.submit(install)
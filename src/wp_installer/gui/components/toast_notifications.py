@@ -4,30 +4,51 @@ Toast Notifications Component
 Handles success, error, warning, and info notifications
 """
 
-try:
-    import ttkbootstrap as ttk
+from . import MODERN_UI
+
+if MODERN_UI:
     from ttkbootstrap.toast import ToastNotification
-    MODERN_UI = True
-except ImportError:
-    import tkinter as tk
+else:
     from tkinter import messagebox
-    MODERN_UI = False
+
+# style -> (title, duration in ms, bootstyle)
+TOAST_STYLES = {
+    "success": ("Success", 3000, "success"),
+    "error": ("Error", 5000, "danger"),
+    "warning": ("Warning", 4000, "warning"),
+    "info": ("Info", 3000, "info"),
+}
 
 class ToastManager:
+    __slots__ = ('modern_ui', '_toasts')
+    
     def __init__(self):
         self.modern_ui = MODERN_UI
+        
+        # One reusable notification per style
+        self._toasts = {}
+        if self.modern_ui:
+            for style, (title, duration, bootstyle) in TOAST_STYLES.items():
+                self._toasts[style] = ToastNotification(title=title, message="",
+                                                        duration=duration, bootstyle=bootstyle)
     
     def show_toast(self, message, style="info"):
         """Show toast notification"""
         if self.modern_ui:
-            if style == "success":
-                ToastNotification(title="Success", message=message, duration=3000, bootstyle="success").show_toast()
-            elif style == "error":
-                ToastNotification(title="Error", message=message, duration=5000, bootstyle="danger").show_toast()
-            elif style == "warning":
-                ToastNotification(title="Warning", message=message, duration=4000, bootstyle="warning").show_toast()
+            if style not in TOAST_STYLES:
+                style = "info"
+            toast = self._toasts[style]
+            
+            # A toast still on screen keeps its own instance so its hide timer stays valid
+            toplevel = getattr(toast, "toplevel", None)
+            if toplevel is not None and toplevel.winfo_exists():
+                title, duration, bootstyle = TOAST_STYLES[style]
+                toast = ToastNotification(title=title, message=message,
+                                          duration=duration, bootstyle=bootstyle)
+                self._toasts[style] = toast
             else:
-                ToastNotification(title="Info", message=message, duration=3000, bootstyle="info").show_toast()
+                toast.message = message
+            toast.show_toast()
         else:
             # Fallback to messagebox for non-modern UI
             if style == "error":
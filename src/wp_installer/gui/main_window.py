@@ -4,37 +4,47 @@ Modern Main Window for WordPress Auto Installer
 Modular design with separate components
 """
 
+import socket
+import subprocess
 import sys
 import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import tkinter as tk
 
-try:
-    import ttkbootstrap as ttk
-    from ttkbootstrap.constants import *
-    MODERN_UI = True
-except ImportError:
-    import tkinter as tk
-    import tkinter.ttk as ttk
-    MODERN_UI = False
-
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from ..utils.logger import logger
 from ..utils.config import config_manager
-from ..core.database import DatabaseManager
-from ..core.wordpress import WordPressInstaller
 
-# Import modular components
+# Import modular components (tabs are imported when they are built)
+from .components import ttk, MODERN_UI
 from .components.console_panel import ConsolePanel
-from .components.single_install_tab import SingleInstallTab
-from .components.bulk_install_tab import BulkInstallTab
-from .components.management_tab import ManagementTab
-from .components.plugin_management_tab import PluginManagementTab
-from .components.settings_tab import SettingsTab
 from .components.toast_notifications import ToastManager
 
+# Seconds a mysqld process probe result stays valid
+MYSQLD_PROBE_TTL = 2.0
+
+# Default MySQL TCP port used by XAMPP
+MYSQL_PORT = 3306
+
+# bootstyle keyword arguments per widget role, resolved once for the active theme
+_BOOTSTYLES = {
+    'error_frame': "danger",
+    'error_title': "danger",
+    'retry': "success",
+    'exit': "danger",
+    'header': "dark",
+    'title': "inverse-dark",
+    'test_button': "success-outline",
+    'settings_button': "info-outline",
+    'notebook': "dark",
+    'status_bar': "inverse",
+}
+STYLE = {role: ({'bootstyle': style} if MODERN_UI else {}) for role, style in _BOOTSTYLES.items()}
+
 class ModernMainWindow:
     def __init__(self):
         # Initialize GUI framework
@@ -47,10 +57,25 @@ class ModernMainWindow:
         self.root.title("WordPress Auto Installer - Modern Edition")
         self.root.geometry("1400x900")
         self.root.minsize(1200, 700)
+        self._screen_width = self.root.winfo_screenwidth()
+        self._screen_height = self.root.winfo_screenheight()
         
-        # Lazy initialization for managers
+        # Lazy initialization for managers (locked so prewarm and first use build them once)
         self._db_manager = None
         self._wp_installer = None
+        self._db_manager_lock = threading.Lock()
+        self._wp_installer_lock = threading.Lock()
+        self._prewarm = []
+        
+        # Latest status bar message waiting to be drawn
+        self._pending_status = None
+        self._status_scheduled = False
+        
+        # Site installs run one at a time so they never race on htdocs or MySQL
+        self.install_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="installer")
+        
+        # (timestamp, result) of the last mysqld process probe
+        self._mysqld_probe = None
         
         # Initialize toast manager
         self.toast_manager = ToastManager()
@@ -66,6 +91,12 @@ class ModernMainWindow:
         if not self.validate_startup_requirements():
             return  # Exit if requirements not met
             
+        # Build both managers in the background while the window is drawn
+        prewarm_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="prewarm")
+        self._prewarm = [prewarm_pool.submit(lambda: self.db_manager),
+                         prewarm_pool.submit(lambda: self.wp_installer)]
+        prewarm_pool.shutdown(wait=False)
+        
         self.setup_modern_gui()
         
         # Test connections on startup
@@ -75,14 +106,20 @@ class ModernMainWindow:
     def db_manager(self):
         """Lazy initialization of database manager"""
         if self._db_manager is None:
-            self._db_manager = DatabaseManager()
+            with self._db_manager_lock:
+                if self._db_manager is None:
+                    from ..core.database import DatabaseManager
+                    self._db_manager = DatabaseManager()
         return self._db_manager
     
     @property
     def wp_installer(self):
         """Lazy initialization of WordPress installer"""
         if self._wp_installer is None:
-            self._wp_installer = WordPressInstaller()
+            with self._wp_installer_lock:
+                if self._wp_installer is None:
+                    from ..core.wordpress import WordPressInstaller
+                    self._wp_installer = WordPressInstaller()
         return self._wp_installer
     
     def setup_rounded_styles(self):
@@ -94,60 +131,71 @@ class ModernMainWindow:
         except Exception as e:
             logger.error(f"Failed to setup rounded styles: {e}")
     
+    def is_mysql_running(self):
+        """Check for a running mysqld, reusing a result younger than MYSQLD_PROBE_TTL"""
+        now = time.monotonic()
+        if self._mysqld_probe is not None and now - self._mysqld_probe[0] < MYSQLD_PROBE_TTL:
+            return self._mysqld_probe[1]
+        
+        # A listening MySQL port answers without spawning any process; a failed
+        # connect is inconclusive (e.g. named-pipe only servers), so fall through
+        host = config_manager.get('xampp.mysql_host') or 'localhost'
+        if host == 'localhost':
+            host = '127.0.0.1'  # Skip name resolution for the common case
+        try:
+            socket.create_connection((host, MYSQL_PORT), timeout=0.3).close()
+            self._mysqld_probe = (now, True)
+            return True
+        except OSError:
+            pass
+        
+        try:
+            # Try to check MySQL service on Windows
+            result = subprocess.run(['tasklist', '/FI', 'IMAGENAME eq mysqld.exe'],
+                                    capture_output=True, text=True,
+                                    creationflags=getattr(subprocess, 'CREATE_NO_WINDOW', 0))
+            mysql_running = 'mysqld.exe' in result.stdout
+        except Exception:
+            # Alternative check - try to connect to MySQL
+            try:
+                success, _ = self.db_manager.test_connection()
+                mysql_running = success
+            except Exception:
+                mysql_running = False
+        
+        self._mysqld_probe = (now, mysql_running)
+        return mysql_running
+    
     def validate_startup_requirements(self):
         """Validate that XAMPP and MySQL are running"""
-        import subprocess
-        import sys
-        from tkinter import messagebox
-        
         try:
             logger.info("Validating startup requirements...")
             
             # Check if MySQL service is running
-            mysql_running = False
-            try:
-                # Try to check MySQL service on Windows
-                result = subprocess.run(['tasklist', '/FI', 'IMAGENAME eq mysqld.exe'], 
-                                      capture_output=True, text=True, shell=True)
-                mysql_running = 'mysqld.exe' in result.stdout
-            except Exception:
-                # Alternative check - try to connect to MySQL
-                try:
-                    success, _ = self.db_manager.test_connection()
-                    mysql_running = success
-                except Exception:
-                    mysql_running = False
+            mysql_running = self.is_mysql_running()
             
             if not mysql_running:
                 logger.error("MySQL service not running")
+                # Reuse the themed root as parent instead of creating a second Tk interpreter
                 if MODERN_UI:
-                    error_window = ttk.Window(themename="superhero")
+                    error_window = ttk.Toplevel(self.root)
                 else:
-                    error_window = tk.Tk()
+                    error_window = tk.Toplevel(self.root)
                 
                 error_window.title("WordPress Auto Installer - Requirements Check")
-                error_window.geometry("500x300")
                 error_window.resizable(False, False)
                 
-                # Center the window
-                error_window.update_idletasks()
-                x = (error_window.winsys_x() + error_window.winfo_width()//2)
-                y = (error_window.winsys_y() + error_window.winfo_height()//2)
-                error_window.geometry(f"+{x}+{y}")
+                # Size and center the window in one call
+                x = (self._screen_width - 500) // 2
+                y = (self._screen_height - 300) // 2
+                error_window.geometry(f"500x300+{x}+{y}")
                 
                 # Create error message
-                if MODERN_UI:
-                    main_frame = ttk.Frame(error_window, bootstyle="danger")
-                else:
-                    main_frame = ttk.Frame(error_window)
+                main_frame = ttk.Frame(error_window, **STYLE['error_frame'])
                 main_frame.pack(fill="both", expand=True, padx=20, pady=20)
                 
-                if MODERN_UI:
-                    title_label = ttk.Label(main_frame, text="⚠️ Requirements Not Met", 
-                                          font=("Segoe UI", 16, "bold"), bootstyle="danger")
-                else:
-                    title_label = ttk.Label(main_frame, text="⚠️ Requirements Not Met", 
-                                          font=("Segoe UI", 16, "bold"))
+                title_label = ttk.Label(main_frame, text="⚠️ Requirements Not Met", 
+                                      font=("Segoe UI", 16, "bold"), **STYLE['error_title'])
                 title_label.pack(pady=10)
                 
                 message_text = """WordPress Auto Installer requires XAMPP to be running.
@@ -168,22 +216,21 @@ Steps to fix:
                 button_frame = ttk.Frame(main_frame)
                 button_frame.pack(pady=20)
                 
-                if MODERN_UI:
-                    retry_btn = ttk.Button(button_frame, text="🔄 Retry", bootstyle="success",
-                                         command=lambda: self.retry_requirements_check(error_window))
-                    exit_btn = ttk.Button(button_frame, text="❌ Exit", bootstyle="danger",
-                                        command=lambda: self.exit_application(error_window))
-                else:
-                    retry_btn = ttk.Button(button_frame, text="🔄 Retry",
-                                         command=lambda: self.retry_requirements_check(error_window))
-                    exit_btn = ttk.Button(button_frame, text="❌ Exit",
-                                        command=lambda: self.exit_application(error_window))
+                retry_btn = ttk.Button(button_frame, text="🔄 Retry", **STYLE['retry'],
+                                     command=lambda: self.retry_requirements_check(error_window))
+                exit_btn = ttk.Button(button_frame, text="❌ Exit", **STYLE['exit'],
+                                    command=lambda: self.exit_application(error_window))
                 
                 retry_btn.pack(side="left", padx=10)
                 exit_btn.pack(side="left", padx=10)
                 
                 error_window.protocol("WM_DELETE_WINDOW", lambda: self.exit_application(error_window))
-                error_window.mainloop()
+                
+                # Run the dialog modally inside the root's event loop; the main
+                # window stays hidden (not a transient master) until checks pass
+                self.root.withdraw()
+                error_window.grab_set()
+                self.root.wait_window(error_window)
                 
                 return False
             
@@ -197,8 +244,10 @@ Steps to fix:
     def retry_requirements_check(self, error_window):
         """Retry the requirements check"""
         error_window.destroy()
+        self._mysqld_probe = None  # The user may have just started MySQL
         if self.validate_startup_requirements():
             self.setup_modern_gui()
+            self.root.deiconify()
     
     def exit_application(self, error_window):
         """Exit the application"""
@@ -219,39 +268,23 @@ Steps to fix:
     
     def create_header(self):
         """Create modern header with title and quick actions"""
-        if MODERN_UI:
-            header_frame = ttk.Frame(self.root, bootstyle="dark")
-        else:
-            header_frame = ttk.Frame(self.root)
+        header_frame = ttk.Frame(self.root, **STYLE['header'])
         header_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=5)
         header_frame.columnconfigure(1, weight=1)
         
         # Title
-        if MODERN_UI:
-            title_label = ttk.Label(header_frame, text="WordPress Auto Installer", 
-                                  font=("Segoe UI", 18, "bold"), bootstyle="inverse-dark")
-        else:
-            title_label = ttk.Label(header_frame, text="WordPress Auto Installer", 
-                                  font=("Segoe UI", 18, "bold"))
+        title_label = ttk.Label(header_frame, text="WordPress Auto Installer", 
+                              font=("Segoe UI", 18, "bold"), **STYLE['title'])
         title_label.grid(row=0, column=0, sticky="w")
         
         # Quick action buttons
-        if MODERN_UI:
-            quick_frame = ttk.Frame(header_frame, bootstyle="dark")
-        else:
-            quick_frame = ttk.Frame(header_frame)
+        quick_frame = ttk.Frame(header_frame, **STYLE['header'])
         quick_frame.grid(row=0, column=2, sticky="e")
         
-        if MODERN_UI:
-            test_btn = ttk.Button(quick_frame, text="🔄 Test Connections", 
-                                bootstyle="success-outline", command=self.quick_test_connections)
-            settings_btn = ttk.Button(quick_frame, text="⚙️ Settings", 
-                                    bootstyle="info-outline", command=self.open_settings)
-        else:
-            test_btn = ttk.Button(quick_frame, text="🔄 Test Connections", 
-                                command=self.quick_test_connections)
-            settings_btn = ttk.Button(quick_frame, text="⚙️ Settings", 
-                                    command=self.open_settings)
+        test_btn = ttk.Button(quick_frame, text="🔄 Test Connections", 
+                            command=self.quick_test_connections, **STYLE['test_button'])
+        settings_btn = ttk.Button(quick_frame, text="⚙️ Settings", 
+                                command=self.open_settings, **STYLE['settings_button'])
         
         test_btn.pack(side="left", padx=5)
         settings_btn.pack(side="left", padx=5)
@@ -273,43 +306,61 @@ Steps to fix:
     
     def create_tabbed_interface(self, parent):
         """Create tabbed interface for different functionalities"""
-        if MODERN_UI:
-            self.notebook = ttk.Notebook(parent, bootstyle="dark")
-        else:
-            self.notebook = ttk.Notebook(parent)
-        self.notebook.grid(row=0, column=0, sticky="nsew", padx=(0, 5))
+        self.notebook = ttk.Notebook(parent, **STYLE['notebook'])
         
-        # Initialize tab components
+        # Initialize the first tab now and the rest after the first paint
+        from .components.single_install_tab import SingleInstallTab
         self.single_install_tab = SingleInstallTab(self, self.notebook)
+        
+        # Place the notebook once its first tab is populated so it is laid out in one pass
+        self.notebook.grid(row=0, column=0, sticky="nsew", padx=(0, 5))
+        self.root.after_idle(self._build_secondary_tabs)
+    
+    def _build_secondary_tabs(self):
+        """Import and create the tabs that are not visible at startup"""
+        from .components.bulk_install_tab import BulkInstallTab
+        from .components.management_tab import ManagementTab
+        from .components.plugin_management_tab import PluginManagementTab
+        from .components.settings_tab import SettingsTab
+        
         self.bulk_install_tab = BulkInstallTab(self, self.notebook)
         self.management_tab = ManagementTab(self, self.notebook)
         self.plugin_management_tab = PluginManagementTab(self, self.notebook)
         self.settings_tab = SettingsTab(self, self.notebook)
+        
+        # Initial refresh of sites list
+        self.management_tab.refresh_sites_list()
     
     def create_status_bar(self):
         """Create status bar"""
-        if MODERN_UI:
-            self.status_bar = ttk.Label(self.root, text="Ready", relief="sunken", anchor="w", bootstyle="inverse")
-        else:
-            self.status_bar = ttk.Label(self.root, text="Ready", relief="sunken", anchor="w")
+        self.status_bar = ttk.Label(self.root, text="Ready", relief="sunken", anchor="w", **STYLE['status_bar'])
         self.status_bar.grid(row=2, column=0, sticky="ew", padx=5, pady=2)
     
+    def _probe_connections(self):
+        """Run the database and WP-CLI checks concurrently and return both results"""
+        # Let any startup prewarm finish building the managers first
+        for future in self._prewarm:
+            future.exception()
+        
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            # Touch the lazy managers inside the workers so their setup overlaps too
+            db_future = pool.submit(lambda: self.db_manager.test_connection())
+            wp_future = pool.submit(lambda: self.wp_installer.test_wp_cli())
+            return db_future.result(), wp_future.result()
+    
     def quick_test_connections(self):
         """Quick test of connections"""
         def test():
-            self.update_status("Testing connections...")
-            logger.info("Testing database connection...")
-            db_success, db_msg = self.db_manager.test_connection()
-            
-            logger.info("Testing WP-CLI...")
-            wp_success, wp_msg = self.wp_installer.test_wp_cli()
+            self.root.after(0, self.update_status, "Testing connections...")
+            logger.info("Testing database connection and WP-CLI...")
+            (db_success, db_msg), (wp_success, wp_msg) = self._probe_connections()
             
             if db_success and wp_success:
-                self.toast_manager.show_toast("All connections successful!", "success")
-                self.update_status("Ready")
+                self.root.after(0, self.toast_manager.show_toast, "All connections successful!", "success")
+                self.root.after(0, self.update_status, "Ready")
             else:
-                self.toast_manager.show_toast("Some connections failed. Check console.", "error")
-                self.update_status("Connection issues detected")
+                self.root.after(0, self.toast_manager.show_toast, "Some connections failed. Check console.", "error")
+                self.root.after(0, self.update_status, "Connection issues detected")
         
         threading.Thread(target=test, daemon=True).start()
     
@@ -320,43 +371,69 @@ Steps to fix:
                 logger.info("Starting WordPress Auto Installer...")
                 logger.info("Testing connections...")
                 
-                # Test database
-                db_success, db_msg = self.db_manager.test_connection()
+                # Test database and WP-CLI side by side
+                (db_success, db_msg), (wp_success, wp_msg) = self._probe_connections()
                 if not db_success:
                     logger.error(f"Database connection failed: {db_msg}")
-                
-                # Test WP-CLI
-                wp_success, wp_msg = self.wp_installer.test_wp_cli()
                 if not wp_success:
                     logger.error(f"WP-CLI test failed: {wp_msg}")
                 
                 if db_success and wp_success:
                     logger.success("All systems ready!")
-                    self.update_status("Ready - All connections OK")
+                    self.root.after(0, self.update_status, "Ready - All connections OK")
                 else:
-                    self.update_status("Warning - Check console for issues")
+                    self.root.after(0, self.update_status, "Warning - Check console for issues")
                     
             except Exception as e:
                 logger.error(f"Startup test failed: {e}")
-                self.update_status("Error - Check console")
+                self.root.after(0, self.update_status, "Error - Check console")
         
         threading.Thread(target=test, daemon=True).start()
     
+    def confirm(self, title, message, on_yes):
+        """Show a Yes/No dialog without blocking the event loop"""
+        root = self.root
+        dialog = tk.Toplevel(root)
+        dialog.title(title)
+        dialog.resizable(False, False)
+        dialog.transient(root)
+        
+        ttk.Label(dialog, text=message, justify="left").pack(padx=20, pady=(20, 10))
+        buttons = ttk.Frame(dialog)
+        buttons.pack(padx=20, pady=(0, 15))
+        
+        def yes():
+            dialog.destroy()
+            on_yes()
+        
+        ttk.Button(buttons, text="Yes", command=yes).pack(side="left", padx=5)
+        ttk.Button(buttons, text="No", command=dialog.destroy).pack(side="left", padx=5)
+        dialog.bind("<Escape>", lambda e: dialog.destroy())
+        dialog.grab_set()
+    
     def open_settings(self):
         """Open settings tab"""
         self.notebook.select(3)  # Settings is the 4th tab (index 3)
     
     def update_status(self, message):
-        """Update status bar"""
-        self.status_bar.configure(text=message)
+        """Update status bar (coalesced to one write per idle cycle, callable from any thread)"""
+        self._pending_status = message
+        if self._status_scheduled:
+            return
+        self._status_scheduled = True
+        if threading.current_thread() is threading.main_thread():
+            self.root.after_idle(self._flush_status)
+        else:
+            self.root.after(0, self._flush_status)
+    
+    def _flush_status(self):
+        """Write the latest pending status message to the status bar"""
+        self._status_scheduled = False
+        self.status_bar.configure(text=self._pending_status)
     
     def run(self):
         """Run the application"""
         try:
-            # Initial refresh of sites list
-            if hasattr(self, 'management_tab'):
-                self.management_tab.refresh_sites_list()
-            
             logger.info("WordPress Auto Installer GUI started")
             self.root.mainloop()
             
@@ -369,6 +446,7 @@ MainWindow = ModernMainWindow
 
 def run_gui():
     """Entry point for GUI"""
+    config_manager.ensure_initialized()
     app = ModernMainWindow()
     app.run()
 
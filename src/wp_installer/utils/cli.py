@@ -5,28 +5,105 @@ Provides CLI commands for WordPress installation and management
 """
 
 import argparse
+import os
 import sys
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from ..utils.logger import logger
 from ..utils.config import config_manager
-from ..core.database import DatabaseManager
-from ..core.wordpress import WordPressInstaller
+
+# Subcommands in the order they appear in --help
+SUBCOMMANDS = ('install', 'list', 'delete', 'test', 'db', 'config')
+
+# Usage examples shared by the parser epilog and the static help
+_EXAMPLES = """
+Examples:
+  %(prog)s install mysite --title "My Site" --email admin@example.com
+  %(prog)s list
+  %(prog)s delete mysite
+  %(prog)s test
+  %(prog)s config --set xampp.htdocs_path=/path/to/htdocs
+"""
+
+# Top-level help, printed for a bare --help without building any parser
+_STATIC_HELP = """usage: %(prog)s [-h] [-v] [-q] [--config CONFIG] {install,list,delete,test,db,config} ...
+
+WordPress Auto Installer - Command Line Interface
+
+positional arguments:
+  {install,list,delete,test,db,config}
+                        Available commands
+    install             Install WordPress site
+    list                List WordPress sites
+    delete              Delete WordPress site
+    test                Test system requirements
+    db                  Database operations
+    config              Configuration management
+
+options:
+  -h, --help            show this help message and exit
+  -v, --verbose         Enable verbose logging
+  -q, --quiet           Suppress output except errors
+  --config CONFIG       Path to configuration file
+""" + _EXAMPLES
+
+# Global flags that may appear before the subcommand
+_GLOBAL_FLAGS = frozenset({'-v', '--verbose', '-q', '--quiet'})
+
+def _sniff_subcommand(argv: List[str]) -> Optional[str]:
+    """Return the subcommand named in argv, or None if it cannot be told without parsing"""
+    tokens = iter(argv)
+    for token in tokens:
+        if token in _GLOBAL_FLAGS or token.startswith('--config='):
+            continue
+        if token == '--config':
+            next(tokens, None)
+            continue
+        return token if token in SUBCOMMANDS else None
+    return None
+
+# Output formats accepted by list --format
+_FORMATS = frozenset({'table', 'json'})
+
+def _choice(values) -> Callable[[str], str]:
+    """Build an argparse type that accepts only the given values"""
+    allowed = frozenset(values)
+    
+    def check(value: str) -> str:
+        if value not in allowed:
+            raise argparse.ArgumentTypeError(f"choose from {', '.join(sorted(allowed))}")
+        return value
+    return check
+
+def _confirm(prompt: str, default: bool = False) -> bool:
+    """Ask a yes/no question, answering with the default when stdin is not a terminal"""
+    if not sys.stdin.isatty():
+        return default
+    return input(prompt).strip().lower() in ('y', 'yes')
 
 class WordPressCLI:
     def __init__(self):
-        self.parser = self.create_parser()
+        self.parser = None
         self._db_manager = None
         self._wp_installer = None
+        self._dispatch = {
+            'install': self.cmd_install,
+            'list': self.cmd_list,
+            'delete': self.cmd_delete,
+            'test': self.cmd_test,
+            'db': self.cmd_database,
+            'config': self.cmd_config,
+        }
     
     @property
     def db_manager(self):
         """Lazy initialization of database manager"""
         if self._db_manager is None:
+            from ..core.database import DatabaseManager
             self._db_manager = DatabaseManager()
         return self._db_manager
     
@@ -34,22 +111,16 @@ class WordPressCLI:
     def wp_installer(self):
         """Lazy initialization of WordPress installer"""
         if self._wp_installer is None:
+            from ..core.wordpress import WordPressInstaller
             self._wp_installer = WordPressInstaller()
         return self._wp_installer
     
-    def create_parser(self) -> argparse.ArgumentParser:
-        """Create argument parser for CLI"""
+    def create_parser(self, argv: Optional[List[str]] = None) -> argparse.ArgumentParser:
+        """Create argument parser for CLI, building only the subcommand named in argv"""
         parser = argparse.ArgumentParser(
             description="WordPress Auto Installer - Command Line Interface",
             formatter_class=argparse.RawDescriptionHelpFormatter,
-            epilog="""
-Examples:
-  %(prog)s install mysite --title "My Site" --email admin@example.com
-  %(prog)s list
-  %(prog)s delete mysite
-  %(prog)s test
-  %(prog)s config --set xampp.htdocs_path=/path/to/htdocs
-            """
+            epilog=_EXAMPLES
         )
         
         # Global options
@@ -57,10 +128,16 @@ Examples:
         parser.add_argument('-q', '--quiet', action='store_true', help='Suppress output except errors')
         parser.add_argument('--config', help='Path to configuration file')
         
-        # Subcommands
+        # Subcommands (all of them when help or an unknown command needs the full list)
         subparsers = parser.add_subparsers(dest='command', help='Available commands')
+        command = _sniff_subcommand(sys.argv[1:] if argv is None else argv)
+        for name in ((command,) if command else SUBCOMMANDS):
+            getattr(self, f"_add_{name}_parser")(subparsers)
         
-        # Install command
+        return parser
+    
+    def _add_install_parser(self, subparsers):
+        """Register the install command"""
         install_parser = subparsers.add_parser('install', help='Install WordPress site')
         install_parser.add_argument('site_name', help='Name of the site to install')
         install_parser.add_argument('--title', help='Site title')
@@ -71,27 +148,31 @@ Examples:
         install_parser.add_argument('--theme', help='Theme to install')
         install_parser.add_argument('--plugins', help='Comma-separated list of plugins to install')
         install_parser.add_argument('--overwrite', action='store_true', help='Overwrite existing site')
-        
-        # List command
+    
+    def _add_list_parser(self, subparsers):
+        """Register the list command"""
         list_parser = subparsers.add_parser('list', help='List WordPress sites')
-        list_parser.add_argument('--format', choices=['table', 'json'], default='table',
+        list_parser.add_argument('--format', type=_choice(_FORMATS), default='table', metavar='{table,json}',
                                help='Output format')
-        
-        # Delete command
+    
+    def _add_delete_parser(self, subparsers):
+        """Register the delete command"""
         delete_parser = subparsers.add_parser('delete', help='Delete WordPress site')
         delete_parser.add_argument('site_name', help='Name of the site to delete')
         delete_parser.add_argument('--keep-db', action='store_true', help='Keep database when deleting')
         delete_parser.add_argument('--force', action='store_true', help='Skip confirmation prompt')
-        
-        # Test command
-        test_parser = subparsers.add_parser('test', help='Test system requirements')
-        
-        # Database commands
+    
+    def _add_test_parser(self, subparsers):
+        """Register the test command"""
+        subparsers.add_parser('test', help='Test system requirements')
+    
+    def _add_db_parser(self, subparsers):
+        """Register the db command and its subcommands"""
         db_parser = subparsers.add_parser('db', help='Database operations')
         db_subparsers = db_parser.add_subparsers(dest='db_command', help='Database commands')
         
         # Database list
-        db_list_parser = db_subparsers.add_parser('list', help='List databases')
+        db_subparsers.add_parser('list', help='List databases')
         
         # Database backup
         db_backup_parser = db_subparsers.add_parser('backup', help='Backup database')
@@ -102,8 +183,9 @@ Examples:
         db_restore_parser = db_subparsers.add_parser('restore', help='Restore database')
         db_restore_parser.add_argument('db_name', help='Database name')
         db_restore_parser.add_argument('backup_path', help='Path to backup file')
-        
-        # Configuration commands
+    
+    def _add_config_parser(self, subparsers):
+        """Register the config command"""
         config_parser = subparsers.add_parser('config', help='Configuration management')
         config_group = config_parser.add_mutually_exclusive_group()
         config_group.add_argument('--list', action='store_true', help='List all configuration')
@@ -112,19 +194,25 @@ Examples:
         config_group.add_argument('--export', help='Export configuration to file')
         config_group.add_argument('--import', help='Import configuration from file')
         config_group.add_argument('--reset', action='store_true', help='Reset to default configuration')
-        
-        return parser
     
     def run(self, args: Optional[List[str]] = None) -> int:
         """Run CLI with given arguments"""
+        if args is None:
+            args = sys.argv[1:]
+        
+        # Plain --help needs no parser at all
+        if len(args) == 1 and args[0] in ('-h', '--help'):
+            sys.stdout.write(_STATIC_HELP % {'prog': os.path.basename(sys.argv[0])})
+            return 0
+        
         try:
+            self.parser = self.create_parser(args)
             parsed_args = self.parser.parse_args(args)
             
-            # Configure logging
-            if parsed_args.quiet:
-                logger.set_level('ERROR')
-            elif parsed_args.verbose:
-                logger.set_level('DEBUG')
+            # Configure logging only when a flag asks for it
+            level = 'ERROR' if parsed_args.quiet else 'DEBUG' if parsed_args.verbose else None
+            if level:
+                logger.set_level(level)
             
             # Load custom config if specified
             if hasattr(parsed_args, 'config') and parsed_args.config:
@@ -148,21 +236,11 @@ Examples:
     
     def execute_command(self, args) -> int:
         """Execute the specified command"""
-        if args.command == 'install':
-            return self.cmd_install(args)
-        elif args.command == 'list':
-            return self.cmd_list(args)
-        elif args.command == 'delete':
-            return self.cmd_delete(args)
-        elif args.command == 'test':
-            return self.cmd_test(args)
-        elif args.command == 'db':
-            return self.cmd_database(args)
-        elif args.command == 'config':
-            return self.cmd_config(args)
-        else:
+        handler = self._dispatch.get(args.command)
+        if handler is None:
             logger.error(f"Unknown command: {args.command}")
             return 1
+        return handler(args)
     
     def cmd_install(self, args) -> int:
         """Install WordPress site"""
@@ -204,12 +282,13 @@ Examples:
                 import json
                 print(json.dumps(sites, indent=2))
             else:
-                # Table format
-                print(f"{'Site Name':<20} {'URL':<30} {'Database':<10} {'Size':<10}")
-                print("-" * 75)
-                for site in sites:
-                    db_status = "✓" if site['has_database'] else "✗"
-                    print(f"{site['name']:<20} {site['url']:<30} {db_status:<10} {site['size']:<10}")
+                # Table format, written in one go
+                rows = [f"{'Site Name':<20} {'URL':<30} {'Database':<10} {'Size':<10}", "-" * 75]
+                rows += [
+                    f"{site['name']:<20} {site['url']:<30} {('✓' if site['has_database'] else '✗'):<10} {site['size']:<10}"
+                    for site in sites
+                ]
+                sys.stdout.write('\n'.join(rows) + '\n')
             
             return 0
             
@@ -222,8 +301,7 @@ Examples:
         try:
             # Confirm deletion unless --force is used
             if not args.force:
-                response = input(f"Delete WordPress site '{args.site_name}'? [y/N]: ")
-                if response.lower() not in ['y', 'yes']:
+                if not _confirm(f"Delete WordPress site '{args.site_name}'? [y/N]: "):
                     logger.info("Operation cancelled")
                     return 0
             
@@ -261,14 +339,14 @@ Examples:
             
             # Test paths
             htdocs_path = config_manager.get('xampp.htdocs_path')
-            if Path(htdocs_path).exists():
+            if os.path.exists(htdocs_path):
                 logger.success(f"Htdocs path: {htdocs_path}")
             else:
                 logger.error(f"Htdocs path not found: {htdocs_path}")
                 success = False
             
             wordpress_zip = config_manager.get('wordpress.zip_path')
-            if Path(wordpress_zip).exists():
+            if os.path.exists(wordpress_zip):
                 logger.success(f"WordPress zip: {wordpress_zip}")
             else:
                 logger.error(f"WordPress zip not found: {wordpress_zip}")
@@ -292,9 +370,9 @@ Examples:
                 databases = self.db_manager.list_databases()
                 if databases:
                     logger.info("Available databases:")
+                    sizes = self.db_manager.get_database_sizes()
                     for db in databases:
-                        size = self.db_manager.get_database_size(db)
-                        logger.info(f"  {db} ({size})")
+                        logger.info(f"  {db} ({sizes.get(db, 'Unknown')})")
                 else:
                     logger.info("No databases found")
                 
@@ -325,34 +403,30 @@ Examples:
                 
             elif args.set:
                 key, value = args.set
-                config_manager.set(key, value)
-                if config_manager.save_config():
+                if config_manager.set(key, value, persist=True):
                     logger.success(f"Configuration updated: {key} = {value}")
                 else:
                     logger.error("Failed to save configuration")
                     return 1
                     
             elif args.export:
-                if config_manager.save_to_file(args.export):
-                    logger.success(f"Configuration exported to {args.export}")
-                else:
+                if not config_manager.export_config(args.export):
                     logger.error("Failed to export configuration")
                     return 1
                     
-            elif args.import_:
-                if config_manager.load_from_file(args.import_):
-                    logger.success(f"Configuration imported from {args.import_}")
-                else:
+            elif getattr(args, 'import'):
+                if not (config_manager.import_config(getattr(args, 'import')) and config_manager.save_config()):
                     logger.error("Failed to import configuration")
                     return 1
                     
             elif args.reset:
-                response = input("Reset configuration to defaults? [y/N]: ")
-                if response.lower() in ['y', 'yes']:
-                    config_manager.reset_to_defaults()
+                if not _confirm("Reset configuration to defaults? [y/N]: "):
+                    logger.info("Operation cancelled")
+                elif config_manager.reset_to_defaults():
                     logger.success("Configuration reset to defaults")
                 else:
-                    logger.info("Operation cancelled")
+                    logger.error("Failed to reset configuration")
+                    return 1
                     
             return 0
             
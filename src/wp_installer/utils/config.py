@@ -4,22 +4,82 @@ Configuration management for WordPress Auto Installer
 Handles loading, saving, and managing configuration settings
 """
 
+import copy
+import functools
+import mmap
 import os
+import pickle
+import threading
 import yaml
 from pathlib import Path
 from typing import Dict, Any
 from .logger import logger
 
+# Prefer the libyaml bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
+@functools.lru_cache(maxsize=256)
+def _split_path(key_path: str) -> tuple:
+    """Split a dotted key path once and reuse the tuple"""
+    return tuple(key_path.split('.'))
+
+# Settings that must be present and non-empty for a valid config
+_REQUIRED_FIELDS = (
+    'xampp.mysql_user',
+    'xampp.mysql_host',
+    'wordpress.admin_user',
+    'wordpress.admin_password',
+    'wordpress.admin_email',
+    'instances.prefix',
+)
+
 class ConfigManager:
     def __init__(self, config_file=None):
+        # Only the app's own config file gets a pickled parse cache; user-supplied
+        # files are always parsed with the safe YAML loader
+        self.cache_file = None
         if config_file is None:
             # Use path utils to get correct path for both dev and executable
             from .paths import PathUtils
             config_dir = PathUtils.get_app_data_dir("config")
             config_file = config_dir / "wp_installer_config.yaml"
+            self.cache_file = config_dir / "wp_installer_config.yaml.pkl"
         
         self.config_file = Path(config_file)
+        self._flat = {}
+        self._text_cache = None
         self.config = self.load_config()
+        
+        # (raw value, Path) for the last htdocs path handed out
+        self._htdocs_cache = None
+    
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Current configuration; assigning it re-indexes the dotted keys"""
+        return self._config
+    
+    @config.setter
+    def config(self, value: Dict[str, Any]) -> None:
+        self._config = value
+        self._text_cache = None
+        self._rebuild_flat()
+    
+    def _rebuild_flat(self) -> None:
+        """Index every section and value by its dotted key path"""
+        flat = {}
+        stack = [('', self._config)]
+        while stack:
+            prefix, node = stack.pop()
+            if not isinstance(node, dict):
+                continue
+            for key, value in node.items():
+                path = f"{prefix}{key}"
+                flat[path] = value
+                stack.append((f"{path}.", value))
+        self._flat = flat
     
     def get_default_config(self) -> Dict[str, Any]:
         """Get default configuration"""
@@ -49,13 +109,13 @@ class ConfigManager:
         }
     
     def load_config(self) -> Dict[str, Any]:
-        """Load configuration from file or create default"""
+        """Load configuration from file, falling back to the built-in defaults"""
         default_config = self.get_default_config()
+        self._is_default = not self.config_file.exists()
         
-        if self.config_file.exists():
+        if not self._is_default:
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = yaml.safe_load(f)
+                config = self._read_config_file()
                 logger.success(f"Loaded configuration from {self.config_file}")
                 
                 # Merge with defaults for any missing keys
@@ -66,22 +126,82 @@ class ConfigManager:
                 logger.error(f"Error loading config file: {e}")
                 logger.info("Using default configuration...")
         else:
-            # Create default config file
-            self.save_config(default_config)
-            logger.success(f"Created default config file: {self.config_file}")
-            logger.info("Please review and modify the configuration as needed.")
+            logger.info("Using built-in defaults (no config file yet)")
             
         return default_config
     
+    def ensure_initialized(self) -> bool:
+        """Write the default config file if none exists yet"""
+        if self.config_file.exists():
+            return True
+        
+        if not self.save_config():
+            return False
+        logger.success(f"Created default config file: {self.config_file}")
+        logger.info("Please review and modify the configuration as needed.")
+        return True
+    
+    def load_from_file(self, file_path: str) -> bool:
+        """Switch to another config file and load it"""
+        config_file = Path(file_path)
+        if not config_file.exists():
+            logger.error(f"Config file not found: {config_file}")
+            return False
+        
+        self.config_file = config_file
+        self.cache_file = None
+        self.config = self.load_config()
+        return True
+    
+    def reset_to_defaults(self) -> bool:
+        """Replace the configuration with the defaults and save it"""
+        return self.save_config(self.get_default_config())
+    
+    def _read_config_file(self) -> Dict[str, Any]:
+        """Read the YAML config, reusing the pickled copy while it is newer than the file"""
+        if self.cache_file is None:
+            return self._parse_config_file()
+        
+        try:
+            if self.cache_file.stat().st_mtime_ns > self.config_file.stat().st_mtime_ns:
+                with open(self.cache_file, 'rb') as f:
+                    return pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError, AttributeError, ValueError):
+            pass  # Missing or unreadable cache, parse the YAML instead
+        
+        config = self._parse_config_file()
+        try:
+            with open(self.cache_file, 'wb') as f:
+                pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass  # Caching is best effort
+        return config
+    
+    def _parse_config_file(self) -> Dict[str, Any]:
+        """Parse the YAML config file with the safe loader"""
+        try:
+            # Let the parser read straight from the mapped file
+            with open(self.config_file, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                config = yaml.load(mm, Loader=_Loader)
+        except (OSError, ValueError):
+            # mmap refuses empty files, fall back to a plain read
+            with open(self.config_file, 'r', encoding='utf-8') as f:
+                config = yaml.load(f, Loader=_Loader)
+        return config
+    
     def _merge_configs(self, default: Dict[str, Any], user: Dict[str, Any]) -> Dict[str, Any]:
-        """Recursively merge user config with defaults"""
-        result = default.copy()
+        """Merge user config over defaults, walking nested sections with a stack"""
+        result = copy.deepcopy(default)
+        stack = [(result, user)]
         
-        for key, value in user.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_configs(result[key], value)
-            else:
-                result[key] = value
+        while stack:
+            target, source = stack.pop()
+            for key, value in source.items():
+                if isinstance(value, dict) and isinstance(target.get(key), dict):
+                    stack.append((target[key], value))
+                else:
+                    target[key] = value
         
         return result
     
@@ -92,7 +212,10 @@ class ConfigManager:
             
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
             with open(self.config_file, 'w', encoding='utf-8') as f:
-                yaml.dump(config_to_save, f, default_flow_style=False, indent=2)
+                yaml.dump(config_to_save, f, Dumper=_Dumper, default_flow_style=False, indent=2)
+            if self.cache_file is not None:
+                self.cache_file.unlink(missing_ok=True)
+            self._is_default = False
             
             if config is not None:
                 self.config = config
@@ -106,19 +229,18 @@ class ConfigManager:
     
     def get(self, key_path: str, default=None):
         """Get configuration value using dot notation (e.g., 'xampp.mysql_user')"""
-        keys = key_path.split('.')
-        value = self.config
-        
-        try:
-            for key in keys:
-                value = value[key]
-            return value
-        except (KeyError, TypeError):
-            return default
-    
-    def set(self, key_path: str, value: Any) -> bool:
-        """Set configuration value using dot notation"""
-        keys = key_path.split('.')
+        return self._flat.get(key_path, default)
+    
+    def get_htdocs_path(self) -> Path:
+        """Get the XAMPP htdocs path as a Path, reusing it until the setting changes"""
+        raw = self.get('xampp.htdocs_path', '')
+        if self._htdocs_cache is None or self._htdocs_cache[0] != raw:
+            self._htdocs_cache = (raw, Path(raw))
+        return self._htdocs_cache[1]
+    
+    def set(self, key_path: str, value: Any, persist: bool = False) -> bool:
+        """Set configuration value using dot notation, optionally saving to disk"""
+        keys = _split_path(key_path)
         config = self.config
         
         try:
@@ -129,43 +251,53 @@ class ConfigManager:
                 config = config[key]
             
             # Set the final value
+            old = config.get(keys[-1])
             config[keys[-1]] = value
-            return True
+            self._text_cache = None
+            if isinstance(value, dict) or isinstance(old, dict) or key_path not in self._flat:
+                self._rebuild_flat()
+            else:
+                self._flat[key_path] = value
+            # The first change to built-in defaults creates the config file
+            return self.save_config() if persist or self._is_default else True
             
         except Exception as e:
             logger.error(f"Failed to set config value {key_path}: {e}")
             return False
     
+    def update(self, updates: Dict[str, Any]) -> bool:
+        """Deep-merge a nested dict of values into the configuration"""
+        try:
+            self.config = self._merge_configs(self.config, updates)
+            return True
+        
+        except Exception as e:
+            logger.error(f"Failed to update configuration: {e}")
+            return False
+    
     def validate_config(self) -> tuple[bool, list]:
         """Validate configuration and return (is_valid, errors)"""
         errors = []
+        flat = self._flat
         
         # Check required paths
-        htdocs_path = Path(self.get('xampp.htdocs_path', ''))
-        if not htdocs_path.exists():
+        htdocs_path = flat.get('xampp.htdocs_path', '')
+        if not os.path.exists(htdocs_path):
             errors.append(f"htdocs path does not exist: {htdocs_path}")
         
         # Check required fields
-        required_fields = [
-            'xampp.mysql_user',
-            'xampp.mysql_host',
-            'wordpress.admin_user',
-            'wordpress.admin_password',
-            'wordpress.admin_email',
-            'instances.prefix'
-        ]
-        
-        for field in required_fields:
-            if not self.get(field):
-                errors.append(f"Required field '{field}' is missing or empty")
+        errors.extend(
+            f"Required field '{field}' is missing or empty"
+            for field in _REQUIRED_FIELDS if not flat.get(field)
+        )
         
         # Check email format (basic)
-        admin_email = self.get('wordpress.admin_email', '')
+        admin_email = flat.get('wordpress.admin_email', '')
         if admin_email and '@' not in admin_email:
             errors.append("Admin email format is invalid")
         
         # Check max instances
-        max_instances = self.get('instances.max_instances', 0)
+        max_instances = flat.get('instances.max_instances', 0)
         if not isinstance(max_instances, int) or max_instances <= 0:
             errors.append("Max instances must be a positive integer")
         
@@ -177,7 +309,7 @@ class ConfigManager:
             export_path = Path(file_path)
             export_path.parent.mkdir(parents=True, exist_ok=True)
             with open(export_path, 'w', encoding='utf-8') as f:
-                yaml.dump(self.config, f, default_flow_style=False, indent=2)
+                yaml.dump(self.config, f, Dumper=_Dumper, default_flow_style=False, indent=2)
             
             logger.success(f"Configuration exported to {export_path}")
             return True
@@ -187,9 +319,11 @@ class ConfigManager:
             return False
 
     def get_config_text(self) -> str:
-        """Get current configuration as YAML text"""
+        """Get current configuration as YAML text, reusing it until the config changes"""
         try:
-            return yaml.dump(self.config, default_flow_style=False, indent=2)
+            if self._text_cache is None:
+                self._text_cache = yaml.dump(self.config, Dumper=_Dumper, default_flow_style=False, indent=2)
+            return self._text_cache
         except Exception as e:
             logger.error(f"Failed to get configuration text: {e}")
             return ""
@@ -203,7 +337,7 @@ class ConfigManager:
                 return False
             
             with open(import_path, 'r', encoding='utf-8') as f:
-                imported_config = yaml.safe_load(f)
+                imported_config = yaml.load(f, Loader=_Loader)
             
             # Validate imported config
             old_config = self.config
@@ -224,5 +358,24 @@ class ConfigManager:
             logger.error(f"Failed to import configuration: {e}")
             return False
 
+class _LazyConfig:
+    """Stand-in for the global ConfigManager that only reads the config on first use"""
+    
+    _inst = None
+    _lock = threading.Lock()
+    
+    def _instance(self) -> ConfigManager:
+        if _LazyConfig._inst is None:
+            with _LazyConfig._lock:
+                if _LazyConfig._inst is None:
+                    _LazyConfig._inst = ConfigManager()
+        return _LazyConfig._inst
+    
+    def __getattr__(self, name):
+        return getattr(self._instance(), name)
+    
+    def __setattr__(self, name, value):
+        setattr(self._instance(), name, value)
+
 # Global config manager instance
-config_manager = ConfigManager()
+config_manager = _LazyConfig()
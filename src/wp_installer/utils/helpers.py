@@ -5,18 +5,33 @@ File operations, validation, and helper functions
 """
 
 import os
+import re
 import sys
+import time
+import errno
+import ctypes
+import socket
+import selectors
 import subprocess
 import shutil
+import stat
+import tempfile
 import zipfile
-import winreg
 import platform
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Tuple
 from .logger import logger
 from .config import config_manager
 from .paths import PathUtils
 
+# The registry is only there on Windows; keep the module importable elsewhere
+try:
+    import winreg
+except ImportError:
+    winreg = None
+
 # Windows-specific subprocess configuration to prevent CMD window flashing
 if platform.system() == 'Windows':
     # Create startupinfo to hide console windows
@@ -26,10 +41,148 @@ if platform.system() == 'Windows':
 else:
     STARTUP_INFO = None
 
+# Run console tools without a window of their own (0 off Windows)
+CREATION_FLAGS = getattr(subprocess, 'CREATE_NO_WINDOW', 0)
+
+def _scandir_recursive(path: str):
+    """Yield the DirEntry of every regular file under path, skipping symlinks"""
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_symlink():
+                    continue
+                if entry.is_file():
+                    yield entry
+                elif entry.is_dir():
+                    yield from _scandir_recursive(entry.path)
+    except FileNotFoundError:
+        pass  # Directory removed while walking
+
+def _entry_size(entry) -> int:
+    """Size of a scanned file, or 0 if it vanished since the scan"""
+    try:
+        return entry.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+# Instance names: letters, numbers, underscores and hyphens only
+_INSTANCE_NAME_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+
+# WordPress plugin header fields, matched in a single pass over the file head
+_PLUGIN_HEADER_RE = re.compile(
+    r'^[\s/*#@]*(Plugin Name|Plugin URI|Version|Description|Author)\s*:\s*(.+)$',
+    re.IGNORECASE | re.MULTILINE
+)
+_PLUGIN_NAME_RE = re.compile(rb'plugin\s+name\s*:', re.IGNORECASE)
+_PLUGIN_HEADER_KEYS = {
+    'plugin name': 'name',
+    'plugin uri': 'plugin_uri',
+    'version': 'version',
+    'description': 'description',
+    'author': 'author',
+}
+
+# ISA-L backed ZipFile (SIMD inflate, hardware CRC32) when python-isal is installed
+try:
+    from isal.isal_zipfile import ZipFile as _ZipFile
+except ImportError:
+    _ZipFile = zipfile.ZipFile
+
+def _open_zip(path):
+    """Open a zip for reading with the fastest available ZipFile"""
+    return _ZipFile(path, 'r')
+
+def _zip_member_target(root: str, name: str) -> Optional[str]:
+    """Resolve a zip member name under root, or None if it would land outside it"""
+    target = os.path.normpath(os.path.join(root, name))
+    if os.path.commonpath([root, target]) != root:
+        return None
+    return target
+
+def _extract_zip_members(zip_path, members) -> None:
+    """Write (ZipInfo, target) pairs using this thread's own ZipFile handle"""
+    with _open_zip(zip_path) as zip_ref:
+        for info, target in members:
+            with zip_ref.open(info) as src, open(target, 'wb') as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+
+def _find_wordpress_zip_in(directory) -> Optional[Path]:
+    """Return the first wordpress*.zip file in directory, stopping at the first match"""
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.startswith('wordpress') and entry.name.endswith('.zip') and entry.is_file():
+                    return Path(entry.path)
+    except OSError:
+        pass  # Missing or unreadable directory
+    return None
+
+# Directories cleanup_directory refuses to delete without force
+_SYSTEM_PATHS = frozenset({'C:\\', 'D:\\', '/', '/usr', '/etc', '/var'})
+
+# path -> (directory mtime, formatted size), so refreshes skip unchanged instances
+_SIZE_CACHE = {}
+
+class InstanceRecord:
+    """WordPress instance entry whose size is only computed when first read"""
+    
+    __slots__ = ('name', 'path', 'url', 'wp_config_exists', 'wp_config_mtime', '_size')
+    _KEYS = frozenset({'name', 'path', 'url', 'size', 'wp_config_exists', 'wp_config_mtime'})
+    
+    def __init__(self, name: str, path: str, url: str, wp_config_exists: bool = True,
+                 wp_config_mtime: Optional[float] = None):
+        self.name = name
+        self.path = path
+        self.url = url
+        self.wp_config_exists = wp_config_exists
+        self.wp_config_mtime = wp_config_mtime
+        self._size = None
+    
+    @property
+    def size(self) -> str:
+        """Human readable size, walked once and reused while the directory mtime is unchanged"""
+        if self._size is None:
+            self._size = Helpers.get_cached_directory_size(self.path)
+        return self._size
+    
+    def __getitem__(self, key: str):
+        """Dict-style access so callers using inst['size'] keep working"""
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def get(self, key: str, default=None):
+        """Dict-style get"""
+        try:
+            return self[key]
+        except KeyError:
+            return default
+    
+    def as_dict(self) -> dict:
+        """Plain dict copy, e.g. for JSON output (computes the size)"""
+        return {key: getattr(self, key) for key in ('name', 'path', 'url', 'size', 'wp_config_exists', 'wp_config_mtime')}
+
+# Successful environment probes, kept for the rest of the session. Failures are
+# not stored so a later check still sees PHP or WP-CLI once it is installed
+_PROBE_CACHE = {}
+
+# System PATH entries already read from the registry this session
+_SYSTEM_PATH_ENTRIES = set()
+
+def _broadcast_environment_change() -> None:
+    """Tell running programs the environment changed, without waiting on hung windows"""
+    HWND_BROADCAST, WM_SETTINGCHANGE, SMTO_ABORTIFHUNG = 0xFFFF, 0x001A, 0x0002
+    result = ctypes.c_ulong()
+    ctypes.windll.user32.SendMessageTimeoutW(HWND_BROADCAST, WM_SETTINGCHANGE, 0, 'Environment',
+                                             SMTO_ABORTIFHUNG, 1000, ctypes.byref(result))
+
 class Helpers:
     @staticmethod
-    def find_wp_cli_executable() -> Optional[str]:
-        """Find WP-CLI executable"""
+    def find_wp_cli_executable() -> Optional[Tuple[str, ...]]:
+        """Find WP-CLI and return its argv prefix, reusing the first successful lookup"""
+        if 'wp_cli' in _PROBE_CACHE:
+            return _PROBE_CACHE['wp_cli']
+        
         wp_commands = [
             'wp',
             'wp.bat', 
@@ -40,42 +193,39 @@ class Helpers:
         
         for wp_cmd in wp_commands:
             try:
-                if wp_cmd.startswith('php'):
-                    cmd_list = wp_cmd.split()
-                    result = subprocess.run(cmd_list + ['--version'], capture_output=True, text=True, 
-                                          shell=True, startupinfo=STARTUP_INFO)
-                else:
-                    result = subprocess.run([wp_cmd, '--version'], capture_output=True, text=True, 
-                                          shell=True, startupinfo=STARTUP_INFO)
+                # PHAR commands are 'php <path>', everything else is a single executable
+                wp_argv = tuple(wp_cmd.split())
+                result = subprocess.run([*wp_argv, '--version'], capture_output=True, text=True,
+                                        startupinfo=STARTUP_INFO, creationflags=CREATION_FLAGS)
                 
                 if result.returncode == 0:
                     logger.success(f"WP-CLI found: {result.stdout.strip()}")
-                    return wp_cmd
-            except (FileNotFoundError, subprocess.SubprocessError):
+                    _PROBE_CACHE['wp_cli'] = wp_argv
+                    return wp_argv
+            except (OSError, subprocess.SubprocessError):
                 continue
         
         logger.error("WP-CLI not found!")
         return None
     
     @staticmethod
-    def run_wp_cli_command(wp_command: str, command: List[str], path: Optional[Path] = None) -> subprocess.CompletedProcess:
-        """Execute WP-CLI command"""
-        if wp_command.startswith('php'):
-            # For PHAR-based installation
-            cmd = wp_command.split() + command
-        else:
-            # For standard installation
-            cmd = [wp_command] + command
+    def run_wp_cli_command(wp_command: Tuple[str, ...], command: List[str], path: Optional[Path] = None) -> subprocess.CompletedProcess:
+        """Execute WP-CLI command using the argv prefix from find_wp_cli_executable"""
+        if isinstance(wp_command, str):
+            # Older callers pass the command as a single string
+            wp_command = wp_command.split()
+        cmd = [*wp_command, *command]
         
         # Use cwd parameter instead of --path for better compatibility
         cwd = str(path) if path else None
-        return subprocess.run(cmd, capture_output=True, text=True, cwd=cwd, shell=True, startupinfo=STARTUP_INFO)
+        return subprocess.run(cmd, capture_output=True, text=True, cwd=cwd,
+                              startupinfo=STARTUP_INFO, creationflags=CREATION_FLAGS)
     
     @staticmethod
     def get_directory_size(path: Path) -> str:
         """Get human readable directory size"""
         try:
-            total_size = sum(f.stat().st_size for f in path.rglob('*') if f.is_file())
+            total_size = sum(_entry_size(entry) for entry in _scandir_recursive(str(path)))
             
             for unit in ['B', 'KB', 'MB', 'GB']:
                 if total_size < 1024.0:
@@ -86,6 +236,23 @@ class Helpers:
             logger.debug(f"Error calculating directory size for {path}: {e}")
             return "Unknown"
     
+    @staticmethod
+    def get_cached_directory_size(path) -> str:
+        """Get human readable directory size, reusing the last walk while the directory mtime is unchanged"""
+        path = str(path)
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except OSError:
+            _SIZE_CACHE.pop(path, None)
+            return "Unknown"
+        cached = _SIZE_CACHE.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        # One entry per path; a newer mtime replaces the stale size
+        size = Helpers.get_directory_size(path)
+        _SIZE_CACHE[path] = (mtime_ns, size)
+        return size
+    
     @staticmethod
     def extract_wordpress_zip(zip_path: Path, destination: Path) -> bool:
         """Extract WordPress from zip file"""
@@ -95,26 +262,41 @@ class Helpers:
             # Create destination directory
             destination.mkdir(parents=True, exist_ok=True)
             
-            # Extract WordPress zip
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                # Extract all files to a temporary directory first
-                temp_extract = destination / "temp_extract"
-                zip_ref.extractall(temp_extract)
+            root = os.path.abspath(destination)
+            
+            # Create the directory tree up front so workers only write files
+            members = []
+            made_dirs = set()
+            with _open_zip(zip_path) as zip_ref:
+                infos = zip_ref.infolist()
                 
-                # WordPress zip typically contains a 'wordpress' folder
-                wordpress_folder = temp_extract / "wordpress"
-                if wordpress_folder.exists():
-                    # Move contents of wordpress folder to destination
-                    for item in wordpress_folder.iterdir():
-                        shutil.move(str(item), str(destination / item.name))
-                    # Remove the temporary extraction directory
-                    shutil.rmtree(temp_extract)
-                else:
-                    # If no wordpress folder, assume files are at root level
-                    for item in temp_extract.iterdir():
-                        shutil.move(str(item), str(destination / item.name))
-                    # Remove the temporary extraction directory
-                    shutil.rmtree(temp_extract)
+                # WordPress zip typically contains a 'wordpress' folder; extract its
+                # contents straight into destination instead of moving them afterwards
+                prefix = 'wordpress/'
+                if not any(info.filename.startswith(prefix) for info in infos):
+                    prefix = ''
+                
+                for info in infos:
+                    if not info.filename.startswith(prefix):
+                        continue
+                    name = info.filename[len(prefix):]
+                    if not name:
+                        continue
+                    target = _zip_member_target(root, name)
+                    if target is None:
+                        raise ValueError(f"Unsafe path in zip: {info.filename}")
+                    parent = target if info.is_dir() else os.path.dirname(target)
+                    if parent not in made_dirs:
+                        os.makedirs(parent, exist_ok=True)
+                        made_dirs.add(parent)
+                    if not info.is_dir():
+                        members.append((info, target))
+            
+            # zlib releases the GIL, so members inflate in parallel
+            workers = max(1, min(os.cpu_count() or 1, len(members)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="unzip") as pool:
+                list(pool.map(_extract_zip_members, [zip_path] * workers,
+                              [members[i::workers] for i in range(workers)]))
             
             logger.success(f"WordPress extracted successfully to {destination}")
             return True
@@ -123,46 +305,55 @@ class Helpers:
             logger.error(f"Failed to extract WordPress zip: {str(e)}")
             return False
     
+    @staticmethod
+    def fast_copy(src, dst) -> None:
+        """Copy a file with the OS native copy routine, preserving metadata"""
+        if platform.system() == 'Windows':
+            # CopyFileW copies in kernel space and keeps timestamps/attributes
+            if not ctypes.windll.kernel32.CopyFileW(str(src), str(dst), False):
+                raise ctypes.WinError()
+        else:
+            # shutil.copy2 already uses sendfile/fcopyfile on Linux and macOS
+            shutil.copy2(src, dst)
+    
     @staticmethod
     def find_wordpress_zip() -> Optional[Path]:
         """Find WordPress zip file in the assets directory"""
-        # Look in assets directory first
-        assets_dir = PathUtils.get_app_data_dir("assets")
-        wp_zip_files = list(assets_dir.glob("wordpress*.zip"))
+        # Look in assets directory first, then the script directory (backward compatibility)
+        search_dirs = (
+            PathUtils.get_app_data_dir("assets"),
+            Path(__file__).parent.parent.parent.parent
+        )
         
-        if wp_zip_files:
-            wp_zip_file = wp_zip_files[0]  # Use the first WordPress zip found
-            logger.info(f"Using WordPress zip: {wp_zip_file.name}")
-            return wp_zip_file
-        
-        # Fallback to script directory (backward compatibility)
-        script_dir = Path(__file__).parent.parent.parent.parent
-        wp_zip_files = list(script_dir.glob("wordpress*.zip"))
-        
-        if wp_zip_files:
-            wp_zip_file = wp_zip_files[0]
-            logger.info(f"Using WordPress zip: {wp_zip_file.name}")
-            return wp_zip_file
+        for search_dir in search_dirs:
+            wp_zip_file = _find_wordpress_zip_in(search_dir)
+            if wp_zip_file:
+                logger.info(f"Using WordPress zip: {wp_zip_file.name}")
+                return wp_zip_file
         
         logger.error("WordPress zip file not found. Please ensure wordpress-*.zip is in the assets directory.")
         return None
     
     @staticmethod
-    def cleanup_directory(path: Path, force: bool = False) -> bool:
-        """Safely remove directory"""
+    def cleanup_directory(path: Path, force: bool = False, report_size: bool = False) -> bool:
+        """Safely remove directory, optionally logging how much space was freed"""
         try:
             if not path.exists():
                 return True
             
             if not force:
                 # Basic safety check - don't delete system directories
-                system_paths = ['C:\\', 'D:\\', '/', '/usr', '/etc', '/var']
-                if str(path) in system_paths or len(str(path)) < 5:
+                if str(path) in _SYSTEM_PATHS or len(str(path)) < 5:
                     logger.error(f"Refusing to delete system path: {path}")
                     return False
             
+            freed = ""
+            if report_size:
+                total_size = sum(_entry_size(entry) for entry in _scandir_recursive(str(path)))
+                freed = f" ({Helpers.format_file_size(total_size)})"
+            
             shutil.rmtree(path)
-            logger.success(f"Removed directory: {path}")
+            logger.success(f"Removed directory: {path}{freed}")
             return True
             
         except Exception as e:
@@ -182,8 +373,7 @@ class Helpers:
             return False, "Instance name must be less than 50 characters"
         
         # Check for valid characters (alphanumeric, underscore, hyphen)
-        import re
-        if not re.match(r'^[a-zA-Z0-9_-]+$', name):
+        if not _INSTANCE_NAME_RE.match(name):
             return False, "Instance name can only contain letters, numbers, underscores, and hyphens"
         
         # Check if name starts with letter or number
@@ -212,29 +402,30 @@ class Helpers:
         return None
     
     @staticmethod
-    def get_available_instances() -> List[dict]:
-        """Get list of all WordPress instances"""
+    def get_available_instances() -> List[InstanceRecord]:
+        """Get list of all WordPress instances; sizes are computed on first access"""
         instances = []
-        htdocs = Path(config_manager.get('xampp.htdocs_path', ''))
+        htdocs = config_manager.get('xampp.htdocs_path', '')
         prefix = config_manager.get('instances.prefix', 'wp_test_')
         base_url = config_manager.get('wordpress.base_url', 'http://localhost')
         
-        if not htdocs.exists():
+        if not os.path.isdir(htdocs):
             return instances
         
-        for item in htdocs.iterdir():
-            if item.is_dir() and item.name.startswith(prefix):
-                wp_config = item / 'wp-config.php'
-                if wp_config.exists():
-                    instances.append({
-                        'name': item.name,
-                        'path': str(item),
-                        'url': f"{base_url}/{item.name}",
-                        'size': Helpers.get_directory_size(item),
-                        'wp_config_exists': True
-                    })
+        with os.scandir(htdocs) as entries:
+            for entry in entries:
+                if not (entry.name.startswith(prefix) and entry.is_dir(follow_symlinks=False)):
+                    continue
+                # One stat answers both "is there a wp-config.php" and when it last changed
+                try:
+                    wp_config = os.stat(os.path.join(entry.path, 'wp-config.php'))
+                except OSError:
+                    continue
+                if stat.S_ISREG(wp_config.st_mode):
+                    instances.append(InstanceRecord(entry.name, entry.path, f"{base_url}/{entry.name}",
+                                                    wp_config_mtime=wp_config.st_mtime))
         
-        return sorted(instances, key=lambda x: x['name'])
+        return sorted(instances, key=attrgetter('name'))
     
     @staticmethod
     def set_file_permissions(path: Path) -> bool:
@@ -264,19 +455,57 @@ class Helpers:
     @staticmethod
     def is_port_available(port: int, host: str = 'localhost') -> bool:
         """Check if a port is available"""
-        import socket
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                sock.settimeout(1)
-                result = sock.connect_ex((host, port))
-                return result != 0  # Port is available if connection fails
-        except Exception:
-            return False
+        return Helpers.are_ports_available([port], host)[port]
+    
+    @staticmethod
+    def are_ports_available(ports: List[int], host: str = 'localhost', timeout: float = 1.0) -> dict:
+        """Check several ports at once; a port is available if nothing accepts a connection"""
+        results = {}
+        pending = {}
+        with selectors.DefaultSelector() as selector:
+            try:
+                # Start every connect without waiting, then wait on all of them together
+                for port in ports:
+                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                    # Track the socket before connecting so the finally block closes it on errors
+                    pending[sock] = port
+                    sock.setblocking(False)
+                    code = sock.connect_ex((host, port))
+                    if code in (errno.EINPROGRESS, errno.EWOULDBLOCK, getattr(errno, 'WSAEWOULDBLOCK', -1)):
+                        selector.register(sock, selectors.EVENT_WRITE)
+                    else:
+                        del pending[sock]
+                        results[port] = code != 0
+                        sock.close()
+                
+                deadline = time.monotonic() + timeout
+                while pending:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    for key, _ in selector.select(remaining):
+                        sock = key.fileobj
+                        port = pending.pop(sock)
+                        selector.unregister(sock)
+                        # Connected means something is listening
+                        results[port] = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) != 0
+                        sock.close()
+                
+                # No answer before the timeout counts as available, like a failed connect
+                for sock, port in pending.items():
+                    results[port] = True
+            except Exception:
+                for port in ports:
+                    results.setdefault(port, False)
+            finally:
+                for sock in pending:
+                    sock.close()
+        
+        return results
     
     @staticmethod
     def get_system_info() -> dict:
         """Get system information"""
-        import platform
         return {
             'platform': platform.system(),
             'platform_version': platform.version(),
@@ -287,20 +516,32 @@ class Helpers:
     
     @staticmethod
     def check_php_installation() -> Tuple[bool, str]:
-        """Check if PHP is accessible via command line"""
+        """Check if PHP is accessible via command line, reusing the first successful check"""
+        if 'php' in _PROBE_CACHE:
+            return _PROBE_CACHE['php']
+        
         try:
-            result = subprocess.run(['php', '--version'], capture_output=True, text=True, 
-                                  shell=True, startupinfo=STARTUP_INFO)
+            result = subprocess.run(['php', '--version'], capture_output=True, text=True,
+                                  startupinfo=STARTUP_INFO, creationflags=CREATION_FLAGS)
             if result.returncode == 0:
-                return True, result.stdout.strip().split('\n')[0]
+                _PROBE_CACHE['php'] = (True, result.stdout.strip().split('\n')[0])
+                return _PROBE_CACHE['php']
             else:
                 return False, "PHP command failed"
-        except (FileNotFoundError, subprocess.SubprocessError) as e:
+        except (OSError, subprocess.SubprocessError) as e:
             return False, f"PHP not found: {e}"
     
     @staticmethod
     def add_to_system_path(directory: str) -> bool:
         """Add directory to system PATH variable"""
+        if winreg is None:
+            logger.error("Updating the system PATH is only supported on Windows")
+            return False
+        
+        if directory in _SYSTEM_PATH_ENTRIES:
+            logger.info(f"{directory} already in system PATH")
+            return True
+        
         try:
             # Open the system environment variables key
             with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, 
@@ -311,16 +552,15 @@ class Helpers:
                 current_path, _ = winreg.QueryValueEx(key, "PATH")
                 
                 # Check if directory is already in PATH
-                paths = [p.strip() for p in current_path.split(';')]
-                if directory not in paths:
+                _SYSTEM_PATH_ENTRIES.update(p.strip() for p in current_path.split(';'))
+                if directory not in _SYSTEM_PATH_ENTRIES:
                     # Add new directory to PATH
                     new_path = current_path + ';' + directory
                     winreg.SetValueEx(key, "PATH", 0, winreg.REG_EXPAND_SZ, new_path)
+                    _SYSTEM_PATH_ENTRIES.add(directory)
                     
                     # Broadcast WM_SETTINGCHANGE to notify other processes
-                    import win32gui
-                    import win32con
-                    win32gui.SendMessage(win32con.HWND_BROADCAST, win32con.WM_SETTINGCHANGE, 0, 'Environment')
+                    _broadcast_environment_change()
                     
                     logger.success(f"Added {directory} to system PATH")
                     return True
@@ -346,7 +586,7 @@ class Helpers:
             assets_dir = PathUtils.get_app_data_dir("assets")
             wp_cli_source = assets_dir / "wp-cli.phar"
             
-            if not wp_cli_source.exists():
+            if not os.path.isfile(wp_cli_source):
                 logger.error("wp-cli.phar not found in assets directory")
                 return False
             
@@ -365,7 +605,8 @@ class Helpers:
             # Test WP-CLI installation
             try:
                 result = subprocess.run(['php', str(wp_cli_target), '--info'], 
-                                      capture_output=True, text=True, shell=True, startupinfo=STARTUP_INFO)
+                                      capture_output=True, text=True,
+                                      startupinfo=STARTUP_INFO, creationflags=CREATION_FLAGS)
                 if result.returncode == 0:
                     logger.success("WP-CLI installed successfully")
                     return True
@@ -381,120 +622,85 @@ class Helpers:
             return False
     
     @staticmethod
-    def validate_plugin_file(file_path: str) -> bool:
-        """Validate if a file is a valid WordPress plugin zip"""
+    def inspect_plugin_zip(file_path: str) -> Tuple[bool, dict]:
+        """Validate a plugin ZIP and read its header in one pass, returning (is_valid, plugin_info)"""
+        plugin_info = {
+            'name': os.path.basename(file_path).replace('.zip', ''),
+            'version': 'Unknown',
+            'description': 'No description available',
+            'author': 'Unknown',
+            'plugin_uri': '',
+            'valid': False
+        }
+        
         try:
             if not file_path.endswith('.zip'):
                 logger.error("Plugin file must be a ZIP archive")
-                return False
+                return False, plugin_info
             
             if not os.path.exists(file_path):
                 logger.error(f"Plugin file not found: {file_path}")
-                return False
+                return False, plugin_info
             
-            # Try to open the zip file
-            with zipfile.ZipFile(file_path, 'r') as zip_ref:
-                file_list = zip_ref.namelist()
+            with _open_zip(file_path) as zip_ref:
+                infos = zip_ref.infolist()
+                root_phps = [info for info in infos if '/' not in info.filename and info.filename.endswith('.php')]
                 
                 # Check if it contains PHP files (basic plugin check)
-                has_php = any(f.endswith('.php') for f in file_list)
-                if not has_php:
+                if not root_phps and not any(info.filename.endswith('.php') for info in infos):
                     logger.warning("ZIP file doesn't contain PHP files - may not be a WordPress plugin")
-                    return False
+                    return False, plugin_info
                 
-                # Look for plugin header in main PHP files
-                for file_name in file_list:
-                    if file_name.endswith('.php') and not '/' in file_name:  # Main directory PHP files
-                        try:
-                            with zip_ref.open(file_name) as php_file:
-                                content = php_file.read(2048).decode('utf-8', errors='ignore')
-                                if 'Plugin Name:' in content or 'plugin name:' in content.lower():
-                                    logger.success(f"Valid WordPress plugin detected: {file_name}")
-                                    return True
-                        except:
-                            continue
+                # Look for plugin header in main directory PHP files
+                for info in root_phps:
+                    try:
+                        with zip_ref.open(info) as php_file:
+                            raw = php_file.read(4096)
+                    except Exception as e:
+                        logger.debug(f"Error reading {info.filename}: {e}")
+                        continue
+                    
+                    # Only presence matters until a header is found, so match the raw bytes
+                    if not _PLUGIN_NAME_RE.search(raw):
+                        continue
+                    
+                    plugin_info['valid'] = True
+                    
+                    # Extract plugin information in one scan, first occurrence wins
+                    seen = set()
+                    for match in _PLUGIN_HEADER_RE.finditer(raw.decode('utf-8', errors='ignore')):
+                        key = _PLUGIN_HEADER_KEYS[match.group(1).lower()]
+                        if key not in seen:
+                            seen.add(key)
+                            plugin_info[key] = match.group(2).strip()
+                    
+                    logger.success(f"Valid WordPress plugin detected: {info.filename}")
+                    return True, plugin_info
                 
                 logger.warning("No WordPress plugin header found - proceeding anyway")
-                return True  # Allow installation even if header not found
+                return True, plugin_info  # Allow installation even if header not found
                 
         except zipfile.BadZipFile:
             logger.error("Invalid ZIP file")
-            return False
+            return False, plugin_info
         except Exception as e:
             logger.error(f"Error validating plugin file: {e}")
-            return False
+            return False, plugin_info
+    
+    @staticmethod
+    def validate_plugin_file(file_path: str) -> bool:
+        """Validate if a file is a valid WordPress plugin zip"""
+        return Helpers.inspect_plugin_zip(file_path)[0]
     
     @staticmethod
     def get_plugin_info_from_zip(file_path: str) -> dict:
         """Extract plugin information from ZIP file"""
-        plugin_info = {
-            'name': os.path.basename(file_path).replace('.zip', ''),
-            'version': 'Unknown',
-            'description': 'No description available',
-            'author': 'Unknown',
-            'plugin_uri': '',
-            'valid': False
-        }
-        
-        try:
-            with zipfile.ZipFile(file_path, 'r') as zip_ref:
-                file_list = zip_ref.namelist()
-                
-                # Look for main plugin file
-                for file_name in file_list:
-                    if file_name.endswith('.php') and not '/' in file_name:
-                        try:
-                            with zip_ref.open(file_name) as php_file:
-                                content = php_file.read(4096).decode('utf-8', errors='ignore')
-                                
-                                # Parse plugin header
-                                if 'Plugin Name:' in content or 'plugin name:' in content.lower():
-                                    plugin_info['valid'] = True
-                                    
-                                    # Extract plugin information using regex
-                                    import re
-                                    
-                                    # Plugin Name
-                                    name_match = re.search(r'Plugin Name:\s*(.+)', content, re.IGNORECASE)
-                                    if name_match:
-                                        plugin_info['name'] = name_match.group(1).strip()
-                                    
-                                    # Version
-                                    version_match = re.search(r'Version:\s*(.+)', content, re.IGNORECASE)
-                                    if version_match:
-                                        plugin_info['version'] = version_match.group(1).strip()
-                                    
-                                    # Description
-                                    desc_match = re.search(r'Description:\s*(.+)', content, re.IGNORECASE)
-                                    if desc_match:
-                                        plugin_info['description'] = desc_match.group(1).strip()
-                                    
-                                    # Author
-                                    author_match = re.search(r'Author:\s*(.+)', content, re.IGNORECASE)
-                                    if author_match:
-                                        plugin_info['author'] = author_match.group(1).strip()
-                                    
-                                    # Plugin URI
-                                    uri_match = re.search(r'Plugin URI:\s*(.+)', content, re.IGNORECASE)
-                                    if uri_match:
-                                        plugin_info['plugin_uri'] = uri_match.group(1).strip()
-                                    
-                                    break
-                                    
-                        except Exception as e:
-                            logger.debug(f"Error reading {file_name}: {e}")
-                            continue
-                            
-        except Exception as e:
-            logger.error(f"Error extracting plugin info: {e}")
-        
-        return plugin_info
+        return Helpers.inspect_plugin_zip(file_path)[1]
     
     @staticmethod
     def create_temp_plugin_dir() -> str:
         """Create a temporary directory for plugin operations"""
         try:
-            import tempfile
             temp_dir = tempfile.mkdtemp(prefix='wp_plugin_')
             logger.debug(f"Created temporary plugin directory: {temp_dir}")
             return temp_dir
@@ -4,14 +4,39 @@ Logging module for WordPress Auto Installer
 Provides consistent logging across all modules
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from datetime import datetime
 from pathlib import Path
 import threading
 import os
 
+class _GuiHandler(logging.Handler):
+    """Passes records to the GUI callback from the log listener thread"""
+    
+    def __init__(self, owner):
+        super().__init__()
+        self.owner = owner
+    
+    def emit(self, record):
+        callback = self.owner.gui_callback
+        if callback:
+            try:
+                callback(getattr(record, 'gui_level', record.levelname), record.getMessage())
+            except Exception:
+                pass  # Ignore GUI callback errors
+
 class Logger:
+    # Message prefixes and GUI levels, built once rather than per call
+    SEPARATOR = "=" * 50
+    _SUCCESS = {'gui_level': 'SUCCESS'}
+    _STEP = {'gui_level': 'STEP'}
+    _PROGRESS = {'gui_level': 'PROGRESS'}
+    _HEADER = {'gui_level': 'HEADER'}
+    
     def __init__(self, log_file=None):
         if log_file is None:
             # Use path utils to get correct path for both dev and executable
@@ -22,9 +47,11 @@ class Logger:
         self.log_file = Path(log_file)
         self.gui_callback = None
         self.lock = threading.Lock()
+        self._listener = None
         
         # Setup logging
         self.setup_logging()
+        atexit.register(self._shutdown)
         
     def setup_logging(self):
         """Setup logging configuration"""
@@ -41,19 +68,47 @@ class Logger:
         # Remove existing handlers
         for handler in self.logger.handlers[:]:
             self.logger.removeHandler(handler)
+        self._shutdown()
         
-        # File handler
+        # File handler, buffered and flushed in batches (immediately on errors)
         self.log_file.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(formatter)
-        self.logger.addHandler(file_handler)
+        self._file_handler = logging.FileHandler(self.log_file, encoding='utf-8')
+        self._file_handler.setLevel(logging.DEBUG)
+        self._file_handler.setFormatter(formatter)
+        self._buffered_file = logging.handlers.MemoryHandler(
+            256, flushLevel=logging.ERROR, target=self._file_handler
+        )
+        
+        # File and GUI output run on a listener thread; callers only enqueue the record
+        log_queue = queue.SimpleQueue()
+        self.logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._listener = logging.handlers.QueueListener(
+            log_queue, self._buffered_file, _GuiHandler(self), respect_handler_level=True
+        )
+        self._listener.start()
         
         # Console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(logging.INFO)
-        console_handler.setFormatter(logging.Formatter('%(message)s'))
-        self.logger.addHandler(console_handler)
+        self.console_handler = logging.StreamHandler(sys.stdout)
+        self.console_handler.setLevel(logging.INFO)
+        self.console_handler.setFormatter(logging.Formatter('%(message)s'))
+        self.logger.addHandler(self.console_handler)
+    
+    def _shutdown(self):
+        """Drain the log queue and write any buffered records to the file"""
+        if self._listener is None:
+            return
+        self._listener.stop()
+        self._listener = None
+        self._buffered_file.close()
+        self._file_handler.close()
+    
+    def set_level(self, level):
+        """Set the console log level by name (e.g., 'DEBUG'); the log file keeps everything"""
+        numeric_level = logging.getLevelName(level.upper())
+        if not isinstance(numeric_level, int) or numeric_level == self.console_handler.level:
+            return
+        with self.lock:
+            self.console_handler.setLevel(numeric_level)
     
     def set_gui_callback(self, callback):
         """Set callback function for GUI logging"""
@@ -64,68 +119,37 @@ class Logger:
         """Add handler to the internal logger"""
         self.logger.addHandler(handler)
     
-    def _log_to_gui(self, level, message):
-        """Send log message to GUI if callback is set"""
-        if self.gui_callback:
-            try:
-                self.gui_callback(level, message)
-            except Exception:
-                pass  # Ignore GUI callback errors
-    
     def info(self, message):
         """Log info message"""
-        with self.lock:
-            self.logger.info(message)
-            self._log_to_gui('INFO', message)
+        self.logger.info(message)
     
     def success(self, message):
         """Log success message (special info)"""
-        formatted_message = f"✓ {message}"
-        with self.lock:
-            self.logger.info(formatted_message)
-            self._log_to_gui('SUCCESS', formatted_message)
+        self.logger.info(f"✓ {message}", extra=self._SUCCESS)
     
     def warning(self, message):
         """Log warning message"""
-        formatted_message = f"⚠ {message}"
-        with self.lock:
-            self.logger.warning(formatted_message)
-            self._log_to_gui('WARNING', formatted_message)
+        self.logger.warning(f"⚠ {message}")
     
     def error(self, message):
         """Log error message"""
-        formatted_message = f"❌ {message}"
-        with self.lock:
-            self.logger.error(formatted_message)
-            self._log_to_gui('ERROR', formatted_message)
+        self.logger.error(f"❌ {message}")
     
     def debug(self, message):
         """Log debug message"""
-        with self.lock:
-            self.logger.debug(message)
-            self._log_to_gui('DEBUG', message)
+        self.logger.debug(message)
     
     def step(self, message):
         """Log step message (for process steps)"""
-        formatted_message = f"🔄 {message}"
-        with self.lock:
-            self.logger.info(formatted_message)
-            self._log_to_gui('STEP', formatted_message)
+        self.logger.info(f"🔄 {message}", extra=self._STEP)
     
     def progress(self, message):
         """Log progress message"""
-        formatted_message = f"📋 {message}"
-        with self.lock:
-            self.logger.info(formatted_message)
-            self._log_to_gui('PROGRESS', formatted_message)
+        self.logger.info(f"📋 {message}", extra=self._PROGRESS)
     
     def header(self, message):
         """Log header message (for major sections)"""
-        separator = "=" * 50
-        formatted_message = f"\n{separator}\n{message}\n{separator}"
-        with self.lock:
-            self.logger.info(formatted_message)
-            self._log_to_gui('HEADER', formatted_message)
+        self.logger.info(f"\n{self.SEPARATOR}\n{message}\n{self.SEPARATOR}", extra=self._HEADER)
 
 # Global logger instance
 logger = Logger()
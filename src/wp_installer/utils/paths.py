@@ -5,26 +5,36 @@ Handles application directory resolution for both development and executable env
 """
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 
+@lru_cache(maxsize=1)
+def _app_base_dir() -> Path:
+    """Resolve the application base directory once per process"""
+    if getattr(sys, 'frozen', False):
+        # Running as executable
+        return Path(sys.executable).parent
+    else:
+        # Running in development
+        return Path(__file__).parent.parent.parent.parent
+
+@lru_cache(maxsize=16)
+def _app_data_dir(folder_name: str) -> Path:
+    """Create a data directory on first request and remember it"""
+    data_dir = _app_base_dir() / folder_name
+    data_dir.mkdir(exist_ok=True)
+    return data_dir
+
 class PathUtils:
     @staticmethod
     def get_app_base_dir() -> Path:
         """Get the application base directory for both development and executable environments"""
-        if getattr(sys, 'frozen', False):
-            # Running as executable
-            return Path(sys.executable).parent
-        else:
-            # Running in development
-            return Path(__file__).parent.parent.parent.parent
+        return _app_base_dir()
     
     @staticmethod
     def get_app_data_dir(folder_name: str) -> Path:
         """Get application data directory (config, assets, logs) with fallback creation"""
-        base_dir = PathUtils.get_app_base_dir()
-        data_dir = base_dir / folder_name
-        data_dir.mkdir(exist_ok=True)
-        return data_dir
+        return _app_data_dir(folder_name)
     
     @staticmethod
     def make_relative_to_app(absolute_path: str) -> str: